@@ -3,7 +3,7 @@ import os
 import streamlit as st
 from dotenv import load_dotenv
 
-from utils.helpers.api import get_workflows, test_api
+from utils.helpers.api import cached_get_workflows, cached_test_api, probe_api
 from utils.helpers.document_store import get_document_store
 from utils.helpers.logger import logger
 from utils.helpers.settings import load_settings_from_cookies
@@ -48,23 +48,38 @@ def init_app():
             os.getenv("DEPLOYMENT_ENV") == "local"
             or os.getenv("DEPLOYMENT_ENV") == "production"
         ):
-            if test_api():
+            api_key = st.session_state.api_key
+            api_url = st.session_state.api_url
+            with st.spinner("🔍 Lade Workflows..."):
+                api_ok, workflows = probe_api(api_key, api_url)
+            if api_ok:
+                # The cached call skips test_api's own session state update
+                st.session_state.api_key_tested = True
                 st.sidebar.success("API-Test erfolgreich. API Key ist korrekt.")
-                with st.spinner("🔍 Lade Workflows..."):
-                    workflows = get_workflows()
-                    if workflows:
-                        st.session_state.workflows = workflows
-                    else:
-                        st.error(
-                            "Keine Kategorien verfügbar. Bitte überprüfen Sie den API Key."
-                        )
-                        st.session_state.workflows = None
+                if workflows:
+                    st.session_state.workflows = workflows
+                else:
+                    # Don't keep a failed lookup cached for other sessions
+                    cached_get_workflows.clear()
+                    st.error(
+                        "Keine Kategorien verfügbar. Bitte überprüfen Sie den API Key."
+                    )
+                    st.session_state.workflows = None
             else:
+                cached_test_api.clear()
+                cached_get_workflows.clear()
                 st.sidebar.error(
                     "API-Test fehlgeschlagen. Bitte überprüfen Sie die API-Einstellungen."
                 )
                 st.session_state.workflows = None
 
+        # Anonymization runs locally, start loading the NER model in the
+        # background so the first document does not wait for the full load
+        if os.getenv("DEPLOYMENT_ENV") == "local":
+            from utils.helpers.anonymization.models import preload_model
+
+            preload_model()
+
         st.session_state.initialized = True
 
 
@@ -1,13 +1,11 @@
-import hashlib
 import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives import serialization
 
 from schemas.padnext_v2_py.padx_auf_v2_12 import Auftrag
+from utils.helpers.encrpyter import calculate_sha1, decrypt_file
 from utils.helpers.padnext import read_xml_to_object
 
 # Add the project root to the Python path
@@ -15,55 +13,10 @@ from utils.helpers.padnext import read_xml_to_object
 # sys.path.insert(0, project_root)
 
 
-def calculate_sha1(filename):
-    sha1 = hashlib.sha1()
-    with open(filename, "rb") as f:
-        while True:
-            data = f.read(65536)  # Read in 64kb chunks
-            if not data:
-                break
-            sha1.update(data)
-    return sha1.hexdigest()
-
-
-def decrypt_file(input_file, output_file, private_key):
-    with open(input_file, "rb") as f:
-        # Read the encrypted key length
-        key_length = int.from_bytes(f.read(4), byteorder="big")
-
-        # Read and decrypt the AES key
-        encrypted_key = f.read(key_length)
-        aes_key = private_key.decrypt(
-            encrypted_key,
-            padding.OAEP(
-                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None,
-            ),
-        )
-
-        # Read the IV
-        iv = f.read(16)
-
-        # Read the encrypted data
-        encrypted_data = f.read()
-
-    # Decrypt the data with AES
-    cipher = Cipher(algorithms.AES(aes_key), modes.CFB(iv), backend=default_backend())
-    decryptor = cipher.decryptor()
-    decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
-
-    # Write the decrypted data to the output file
-    with open(output_file, "wb") as f:
-        f.write(decrypted_data)
-
-
 def padnext_decrypt(input_file, output_folder):
     # Load the private key
     with open("ssl/private_key.pem", "rb") as key_file:
-        private_key = serialization.load_pem_private_key(
-            key_file.read(), password=None, backend=default_backend()
-        )
+        private_key = serialization.load_pem_private_key(key_file.read(), password=None)
 
     # Create output folder if it doesn't exist
     os.makedirs(output_folder, exist_ok=True)
@@ -97,14 +50,21 @@ def padnext_decrypt(input_file, output_folder):
         zip_ref.extractall(output_folder)
 
     # Verify file integrity
-    for datei in auftrag.datei:
-        file_path = os.path.join(output_folder, datei.name)
+    file_paths = [os.path.join(output_folder, datei.name) for datei in auftrag.datei]
+    for file_path in file_paths:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        file_size = os.path.getsize(file_path)
-        checksum = calculate_sha1(file_path)
+    # Hash the files in parallel, hashlib releases the GIL while hashing
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        sizes_and_checksums = list(
+            executor.map(
+                lambda path: (os.path.getsize(path), calculate_sha1(path)),
+                file_paths,
+            )
+        )
 
+    for datei, (file_size, checksum) in zip(auftrag.datei, sizes_and_checksums):
         if file_size != datei.dateilaenge.laenge:
             raise ValueError(
                 f"File size mismatch for {datei.name}: expected {datei.dateilaenge.laenge}, got {file_size}"
@@ -1,15 +1,13 @@
-import hashlib
 import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from xml.etree import ElementTree as ET
 
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives import serialization
 from xsdata.formats.dataclass.parsers import XmlParser
 
 from schemas.padnext_v2_py.padx_auf_v2_12 import Auftrag
+from utils.helpers.encrpyter import calculate_sha1, encrypt_file
 from utils.helpers.padnext import write_object_to_xml
 from utils.helpers.transform import (
     format_erstellungsdatum,
@@ -22,62 +20,16 @@ from utils.helpers.transform import (
 # sys.path.insert(0, project_root)
 
 
-def calculate_sha1(filename):
-    sha1 = hashlib.sha1()
-    with open(filename, "rb") as f:
-        while True:
-            data = f.read(65536)  # Read in 64kb chunks
-            if not data:
-                break
-            sha1.update(data)
-    return sha1.hexdigest()
-
-
 def compress_files(files, output_zip):
     with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
         for file in files:
             zipf.write(file, os.path.basename(file))
 
 
-def encrypt_file(input_file, output_file, public_key):
-    with open(input_file, "rb") as f:
-        data = f.read()
-
-    # Generate a random AES key
-    aes_key = os.urandom(32)
-
-    # Encrypt the AES key with the public key
-    encrypted_key = public_key.encrypt(
-        aes_key,
-        padding.OAEP(
-            mgf=padding.MGF1(algorithm=hashes.SHA256()),
-            algorithm=hashes.SHA256(),
-            label=None,
-        ),
-    )
-
-    # Generate a random IV
-    iv = os.urandom(16)
-
-    # Encrypt the data with AES
-    cipher = Cipher(algorithms.AES(aes_key), modes.CFB(iv), backend=default_backend())
-    encryptor = cipher.encryptor()
-    encrypted_data = encryptor.update(data) + encryptor.finalize()
-
-    # Write the encrypted data to the output file
-    with open(output_file, "wb") as f:
-        f.write(len(encrypted_key).to_bytes(4, byteorder="big"))
-        f.write(encrypted_key)
-        f.write(iv)
-        f.write(encrypted_data)
-
-
 def padnext_encrypt(input_folder, output_folder):
     # Load the public key
     with open("ssl/public_key.pem", "rb") as key_file:
-        public_key = serialization.load_pem_public_key(
-            key_file.read(), backend=default_backend()
-        )
+        public_key = serialization.load_pem_public_key(key_file.read())
 
     # Create output folder if it doesn't exist
     os.makedirs(output_folder, exist_ok=True)
@@ -95,17 +47,18 @@ def padnext_encrypt(input_folder, output_folder):
         print(f"Successfully read XML file: {auf_file}")
         print(f"XML content length: {len(xml_string)} characters")
 
-        # Check if the XML is well-formed
-        try:
-            ET.fromstring(xml_string)
-            print("XML is well-formed")
-        except ET.ParseError as pe:
-            print(f"XML is not well-formed: {pe}")
-            # Optionally, print the problematic part of the XML
-            print(xml_string[max(0, pe.position[0] - 100) : pe.position[0] + 100])
-
         # Use FromString method with explicit encoding
-        auftrag: Auftrag = parser.from_string(xml_string, Auftrag)
+        try:
+            auftrag: Auftrag = parser.from_string(xml_string, Auftrag)
+        except Exception:
+            # Only build the ElementTree for diagnostics if parsing failed
+            try:
+                ET.fromstring(xml_string)
+            except ET.ParseError as pe:
+                print(f"XML is not well-formed: {pe}")
+                # Optionally, print the problematic part of the XML
+                print(xml_string[max(0, pe.position[0] - 100) : pe.position[0] + 100])
+            raise
         print("Successfully parsed XML content")
     except UnicodeDecodeError as ude:
         print(f"Error decoding XML file: {ude}")
@@ -145,14 +98,20 @@ def padnext_encrypt(input_folder, output_folder):
 
             datei.name = os.path.basename(file_path)
 
-        file_size = os.path.getsize(file_path)
-        checksum = calculate_sha1(file_path)
+        files_to_encrypt.append(file_path)
 
+    # Hash the files in parallel, hashlib releases the GIL while hashing
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        sizes_and_checksums = list(
+            executor.map(
+                lambda path: (os.path.getsize(path), calculate_sha1(path)),
+                files_to_encrypt,
+            )
+        )
+    for datei, (file_size, checksum) in zip(auftrag.datei, sizes_and_checksums):
         datei.dateilaenge.laenge = file_size
         datei.dateilaenge.pruefsumme = checksum
 
-        files_to_encrypt.append(file_path)
-
     print("Files to encrypt:")
     print(files_to_encrypt)
 
@@ -0,0 +1,107 @@
+import unittest
+
+from utils.helpers.anonymization import Anonymizer
+from utils.helpers.anonymization.processors.date_processor import DateProcessor
+from utils.helpers.anonymization.processors.financial_processor import (
+    FinancialProcessor,
+)
+
+
+def spans(entities):
+    return [(entity["start"], entity["end"]) for entity in entities]
+
+
+class SplitDateTest(unittest.TestCase):
+    def test_split_dates(self):
+        text = "Aufnahme am Montag 12 Mai, Entlassung 3 Juni 2020."
+        detected = DateProcessor()._detect_split_dates(text)
+
+        self.assertEqual(
+            [entity["original_word"] for entity in detected],
+            ["Montag 12 Mai,", "3 Juni 2020."],
+        )
+        for entity in detected:
+            self.assertEqual(
+                text[entity["start"] : entity["end"]], entity["original_word"]
+            )
+
+    def test_repeated_tokens(self):
+        # The second date starts with the same words as the first one
+        text = "am 3 Mai und am 3 Juni 2020"
+        detected = DateProcessor()._detect_split_dates(text)
+
+        self.assertEqual(spans(detected), [(3, 8), (16, 27)])
+        self.assertEqual(text[16:27], "3 Juni 2020")
+
+
+class ConsecutiveNumberTest(unittest.TestCase):
+    def test_repeated_tokens(self):
+        # Both numbers follow an "und" and start with "040"
+        text = "Tel und 040 123 und 040 55 66"
+        detected = FinancialProcessor()._detect_consecutive_numbers(text)
+
+        self.assertEqual(spans(detected), [(8, 15), (20, 29)])
+        for entity in detected:
+            self.assertEqual(
+                text[entity["start"] : entity["end"]], entity["original_word"]
+            )
+
+    def test_single_number_is_ignored(self):
+        detected = FinancialProcessor()._detect_consecutive_numbers("Zimmer 12 frei")
+        self.assertEqual(detected, [])
+
+
+def entity(start, end, entity_type):
+    return {"start": start, "end": end, "entity_type": entity_type}
+
+
+class MergeOverlappingTest(unittest.TestCase):
+    def merge(self, entities):
+        return [
+            (merged["start"], merged["end"], merged["entity_type"])
+            for merged in Anonymizer._merge_overlapping(entities)
+        ]
+
+    def test_disjoint_entities_are_sorted(self):
+        merged = self.merge([entity(10, 15, "PERSON"), entity(0, 4, "DATE_TIME")])
+        self.assertEqual(merged, [(0, 4, "DATE_TIME"), (10, 15, "PERSON")])
+
+    def test_adjacent_entities_stay_separate(self):
+        merged = self.merge([entity(0, 4, "PERSON"), entity(4, 8, "LOCATION")])
+        self.assertEqual(merged, [(0, 4, "PERSON"), (4, 8, "LOCATION")])
+
+    def test_duplicates_collapse(self):
+        merged = self.merge(
+            [entity(3, 9, "FINANCIAL_ID"), entity(3, 9, "FINANCIAL_ID")]
+        )
+        self.assertEqual(merged, [(3, 9, "FINANCIAL_ID")])
+
+    def test_overlap_takes_union_and_higher_priority(self):
+        merged = self.merge(
+            [entity(0, 5, "GENDER_WORD"), entity(3, 12, "FINANCIAL_ID")]
+        )
+        self.assertEqual(merged, [(0, 12, "FINANCIAL_ID")])
+
+    def test_lower_priority_does_not_replace_type(self):
+        merged = self.merge([entity(0, 10, "DATE_TIME"), entity(2, 6, "PERSON")])
+        self.assertEqual(merged, [(0, 10, "DATE_TIME")])
+
+    def test_chain_of_overlaps(self):
+        merged = self.merge(
+            [
+                entity(0, 4, "PERSON"),
+                entity(3, 8, "GENDER_WORD"),
+                entity(7, 11, "ID_NUMBER"),
+                entity(20, 22, "LOCATION"),
+            ]
+        )
+        self.assertEqual(merged, [(0, 11, "ID_NUMBER"), (20, 22, "LOCATION")])
+
+    def test_input_is_not_modified(self):
+        entities = [entity(0, 5, "PERSON"), entity(2, 8, "DATE_TIME")]
+        self.merge(entities)
+        self.assertEqual(entities, [entity(0, 5, "PERSON"), entity(2, 8, "DATE_TIME")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import filecmp
+import io
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from utils.helpers.files import extract_zip
+
+
+def build_archive() -> bytes:
+    """Zip with top-level files, nested files and an explicit directory entry."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for index in range(12):
+            archive.writestr(f"datei_{index}.xml", f"<root>{index}</root>" * 500)
+        archive.writestr("anhang/", "")
+        archive.writestr("anhang/bild.jpg", bytes(range(256)) * 64)
+        archive.writestr("anhang/unter/befund.pdf", b"%PDF-1.4" * 1000)
+    return buffer.getvalue()
+
+
+def assert_same_tree(test: unittest.TestCase, left: Path, right: Path) -> None:
+    comparison = filecmp.dircmp(left, right)
+    test.assertEqual(comparison.left_only, [])
+    test.assertEqual(comparison.right_only, [])
+    _, mismatch, errors = filecmp.cmpfiles(
+        left, right, comparison.common_files, shallow=False
+    )
+    test.assertEqual(mismatch + errors, [])
+    for directory in comparison.common_dirs:
+        assert_same_tree(test, left / directory, right / directory)
+
+
+class ExtractZipTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.archive = build_archive()
+        self.expected = self.root / "expected"
+        with zipfile.ZipFile(io.BytesIO(self.archive)) as archive:
+            archive.extractall(self.expected)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_extractall_for_missing_destination(self):
+        destination = self.root / "neu" / "ziel"
+        zip_path = self.root / "archiv.zip"
+        zip_path.write_bytes(self.archive)
+
+        files = extract_zip(zip_path, destination)
+
+        self.assertEqual(sorted(files), sorted(p.name for p in self.expected.iterdir()))
+        assert_same_tree(self, self.expected, destination)
+
+    def test_matches_extractall_for_file_object(self):
+        destination = self.root / "ziel"
+
+        extract_zip(io.BytesIO(self.archive), destination)
+
+        assert_same_tree(self, self.expected, destination)
+
+    def test_top_level_members_into_missing_destination(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for index in range(16):
+                archive.writestr(f"datei_{index}.xml", f"<root>{index}</root>" * 500)
+
+        # Repeated since the parallel extracts used to race on creating it
+        for attempt in range(20):
+            destination = self.root / f"versuch_{attempt}" / "ziel"
+            files = extract_zip(io.BytesIO(buffer.getvalue()), destination)
+            self.assertEqual(len(files), 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
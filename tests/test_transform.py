@@ -0,0 +1,54 @@
+import unittest
+
+import pandas as pd
+
+from utils.helpers.transform import df_to_items
+
+
+def billing_df(rows):
+    return pd.DataFrame(
+        [
+            {"ziffer": ziffer, "anzahl": anzahl, "faktor": faktor, "text": ""}
+            for ziffer, anzahl, faktor in rows
+        ]
+    )
+
+
+def prices(items):
+    return [(item["ziffer"], item["preis"], item["total"]) for item in items]
+
+
+class DfToItemsPriceTest(unittest.TestCase):
+    def test_exact_factor_uses_its_column(self):
+        items = df_to_items(billing_df([("z 1720", 1, 1.0), ("z 1720", 2, 2.3)]))
+        self.assertEqual(
+            prices(items), [("z 1720", 32.29, 32.29), ("z 1720", 74.27, 148.54)]
+        )
+
+    def test_in_between_factor_uses_thresholds(self):
+        items = df_to_items(
+            billing_df([("z 3169", 1, 1.8), ("z 1060", 1, 1.3), ("z 1060", 1, 2.5)])
+        )
+        self.assertEqual(
+            prices(items),
+            [
+                ("z 3169", 218.58, 218.58),
+                ("z 1060", 53.86, 53.86),
+                ("z 1060", 123.87, 123.87),
+            ],
+        )
+
+    def test_above_maximum_factor_uses_hoechstsatz(self):
+        items = df_to_items(billing_df([("z 2285 A", 1, 4.0), ("z 4655", 1, 4.0)]))
+        self.assertEqual(
+            prices(items), [("z 2285 A", 301.93, 301.93), ("z 4655", 34.1, 34.1)]
+        )
+
+    def test_missing_price_is_skipped(self):
+        # z A has no Regelhöchstsatz, the table lists "-"
+        items = df_to_items(billing_df([("z A", 1, 2.3), ("z 1720", 1, 1.0)]))
+        self.assertEqual(prices(items), [("z 1720", 32.29, 32.29)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+import unittest
+
+from utils.utils import find_zitat_in_text
+
+
+def reference_distance(a: str, b: str) -> int:
+    """Plain dynamic programming Levenshtein distance."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def reference_match(text: str, zitat: str, threshold: int):
+    """First window with the smallest distance within the threshold, extended to a blank."""
+    best_start, best_distance = None, threshold + 1
+    for start in range(len(text) - len(zitat) + 1):
+        distance = reference_distance(zitat, text[start : start + len(zitat)])
+        if distance < best_distance:
+            best_start, best_distance = start, distance
+    if best_start is None:
+        return None
+    end = best_start + len(zitat)
+    while end < len(text) and text[end] != " ":
+        end += 1
+    return text[best_start:end]
+
+
+class FindZitatInTextTest(unittest.TestCase):
+    def test_exact_zitat(self):
+        text = "Der Patient klagt über Schmerzen im Knie links seit drei Tagen."
+        result = find_zitat_in_text([("Knie links", "1234")], [text])
+        self.assertIn(("Knie links", "1234"), result)
+
+    def test_fuzzy_zitat(self):
+        text = "Sonographie des Abdomens ohne pathologischen Befund."
+        result = find_zitat_in_text([("Sonografie des Abdomen", "410")], [text])
+        self.assertIn(("Sonographie des Abdomens", "410"), result)
+
+    def test_zitat_beyond_threshold(self):
+        text = "Beratung des Patienten."
+        result = find_zitat_in_text([("Röntgen der Lendenwirbelsäule", "5110")], [text])
+        self.assertEqual(result, [text])
+
+    def test_matches_reference_levenshtein(self):
+        rng = random.Random(0)
+        words = ["Knie", "links", "Befund", "Ärztin", "ohne", "Größe", "OP", "re."]
+        for _ in range(200):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+            zitat = "".join(
+                char
+                for char in " ".join(
+                    rng.choice(words) for _ in range(rng.randint(1, 3))
+                )
+                if rng.random() > 0.1
+            )
+            # Single spaces only, as find_zitat_in_text normalizes the zitat
+            zitat = " ".join(zitat.split())
+            if not zitat:
+                continue
+
+            expected = reference_match(text, zitat, threshold=3)
+            result = find_zitat_in_text(
+                [(zitat, "label")], [text], distance_threshold=3
+            )
+            found = [item[0] for item in result if isinstance(item, tuple)]
+            self.assertEqual(found, [expected] if expected else [], (text, zitat))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,9 @@
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from utils.helpers.logger import logger
 
-from .constants import ENTITIES
+from .constants import ENTITIES, ENTITY_PRIORITY
 from .processors.base import BaseProcessor
 from .processors.date_processor import DateProcessor
 from .processors.financial_processor import FinancialProcessor
@@ -22,6 +23,40 @@ class Anonymizer:
             NERProcessor(threshold=threshold),
         ]
 
+    @staticmethod
+    def _merge_overlapping(entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge overlapping entities into non-overlapping spans for replacement.
+
+        Overlapping entities are combined into one span covering all of them,
+        labelled with the entity type of the highest priority.
+
+        Args:
+            entities: Entities to replace
+
+        Returns:
+            Non-overlapping spans sorted by start position
+        """
+        merged = []
+        for entity in sorted(entities, key=lambda x: (x["start"], -x["end"])):
+            if merged and entity["start"] < merged[-1]["end"]:
+                last = merged[-1]
+                last["end"] = max(last["end"], entity["end"])
+                if (
+                    ENTITY_PRIORITY[entity["entity_type"]]
+                    > ENTITY_PRIORITY[last["entity_type"]]
+                ):
+                    last["entity_type"] = entity["entity_type"]
+            else:
+                merged.append(
+                    {
+                        "entity_type": entity["entity_type"],
+                        "start": entity["start"],
+                        "end": entity["end"],
+                    }
+                )
+        return merged
+
     def anonymize(self, text: str) -> Dict[str, Any]:
         """
         Anonymize the text using all processors.
@@ -41,15 +76,21 @@ class Anonymizer:
         # Sort entities by start position in descending order
         detected_entities.sort(key=lambda x: x["start"], reverse=True)
 
-        # Replace entities with placeholders in reverse order
-        anonymized_text = text
-        for entity in detected_entities:
-            if entity["entity_type"] in ENTITIES and entity["score"] > self.threshold:
-                anonymized_text = (
-                    anonymized_text[: entity["start"]]
-                    + f"<{entity['entity_type']}>"
-                    + anonymized_text[entity["end"] :]
-                )
+        replaceable_entities = [
+            entity
+            for entity in detected_entities
+            if entity["entity_type"] in ENTITIES and entity["score"] > self.threshold
+        ]
+
+        # Replace entities with placeholders front to back in a single join
+        parts = []
+        cursor = 0
+        for entity in self._merge_overlapping(replaceable_entities):
+            parts.append(text[cursor : entity["start"]])
+            parts.append(f"<{entity['entity_type']}>")
+            cursor = entity["end"]
+        parts.append(text[cursor:])
+        anonymized_text = "".join(parts)
 
         return {
             "anonymized_text": anonymized_text,
@@ -57,6 +98,20 @@ class Anonymizer:
         }
 
 
+@lru_cache(maxsize=4)
+def get_anonymizer(threshold: float = 0.7) -> Anonymizer:
+    """
+    Get the shared Anonymizer for a threshold.
+
+    Args:
+        threshold: Minimum score for entities to be replaced
+
+    Returns:
+        Anonymizer reused by all calls with the same threshold
+    """
+    return Anonymizer(threshold=threshold)
+
+
 def anonymize_text(text: str) -> Dict[str, Any]:
     """
     Anonymize the extracted text locally using all processors.
@@ -68,8 +123,7 @@ def anonymize_text(text: str) -> Dict[str, Any]:
         Dict containing anonymized text and detected entities
     """
     logger.info("Starting text anonymization ...")
-    anonymizer = Anonymizer()
-    result = anonymizer.anonymize(text)
+    result = get_anonymizer().anonymize(text)
     logger.info("Text anonymization completed")
     return result
 
@@ -82,8 +136,7 @@ def anonymize_text_german(
     """
     if use_spacy:
         raise NotImplementedError("SpaCy NER is not implemented.")
-    anonymizer = Anonymizer(threshold=threshold)
-    return anonymizer.anonymize(text)
+    return get_anonymizer(threshold).anonymize(text)
 
 
 """
@@ -1,15 +1,28 @@
 from typing import List, Set, Tuple
 
-# Entity types
-ENTITIES = [
-    "LOCATION",
-    "PERSON",
-    "ORGANIZATION",
-    "DATE_TIME",
-    "GENDER_WORD",
-    "ID_NUMBER",
-    "FINANCIAL_ID",
-]
+# Entity types that are replaced with placeholders
+ENTITIES = frozenset(
+    {
+        "LOCATION",
+        "PERSON",
+        "ORGANIZATION",
+        "DATE_TIME",
+        "GENDER_WORD",
+        "ID_NUMBER",
+        "FINANCIAL_ID",
+    }
+)
+
+# Entity type kept when detected entities overlap, higher wins
+ENTITY_PRIORITY = {
+    "FINANCIAL_ID": 4,
+    "ID_NUMBER": 3,
+    "DATE_TIME": 2,
+    "PERSON": 1,
+    "LOCATION": 1,
+    "ORGANIZATION": 1,
+    "GENDER_WORD": 0,
+}
 
 PRESIDIO_EQUIVALENCES = {
     "PER": "PERSON",
@@ -107,35 +120,37 @@ DATE_PATTERNS = [
     r"\b\d{1,2}[\.-/][O0]\d{1,1}[\.-/][O0\d]{2,4}\b",
 ]
 
-# Gender-related constants
-GENDER_WORDS = [
-    "frau",
-    "frauen",
-    "frauens",
-    "mann",
-    "männer",
-    "mannes",
-    "männern",
-    "herr",
-    "herren",
-    "herrn",
-    "dame",
-    "damen",
-    "dames",
-    "fräulein",
-    "fräuleins",
-    "mädchen",
-    "mädchens",
-    "junge",
-    "jungen",
-    "jungens",
-    "jugendlicher",
-    "jugendliche",
-    "jugendlichen",
-    "person",
-    "personen",
-    "persons",
-]
+# Gender-related constants, a set since every word of the text is looked up
+GENDER_WORDS = frozenset(
+    {
+        "frau",
+        "frauen",
+        "frauens",
+        "mann",
+        "männer",
+        "mannes",
+        "männern",
+        "herr",
+        "herren",
+        "herrn",
+        "dame",
+        "damen",
+        "dames",
+        "fräulein",
+        "fräuleins",
+        "mädchen",
+        "mädchens",
+        "junge",
+        "jungen",
+        "jungens",
+        "jugendlicher",
+        "jugendliche",
+        "jugendlichen",
+        "person",
+        "personen",
+        "persons",
+    }
+)
 
 # Financial and phone patterns
 FINANCIAL_PATTERNS = [
@@ -146,7 +161,6 @@ FINANCIAL_PATTERNS = [
     r"\bDE\d{2}[\s\d]{20,}\b",
     r"IBAN\s*:?\s*DE\d{2}[\s\d]{20,}",
     r"\b(?:BIC|SWIFT)\s*:?\s*[A-Z]{6}[A-Z0-9]{2}(?:[A-Z0-9]{3})?\b",
-    r"\b[A-Z]{6}[A-Z0-9]{2}(?:[A-Z0-9]{3})?\b(?=.*?(?:BIC|SWIFT))",
     r"HRB\s*:?\s*\d{1,6}",
     r"\bHRB\s*\d{1,6}\b",
     r"IK-Nr\.?\s*:?\s*\d{9}",
@@ -175,6 +189,10 @@ PHONE_PATTERNS = [
 # Update FINANCIAL_PATTERNS to include phone patterns
 FINANCIAL_PATTERNS.extend(PHONE_PATTERNS)
 
+# BIC codes without a label, only counted if BIC or SWIFT follows on the same line
+BIC_CODE_PATTERN = r"\b[A-Z]{6}[A-Z0-9]{2}(?:[A-Z0-9]{3})?\b"
+BIC_KEYWORD_PATTERN = r"BIC|SWIFT"
+
 # Whitelist
 WHITELIST = {
     "lichtenstein",
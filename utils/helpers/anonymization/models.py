@@ -1,6 +1,5 @@
 import os
-
-from flair.models import SequenceTagger
+import threading
 
 from utils.helpers.logger import logger
 
@@ -11,9 +10,21 @@ MODEL_LANGUAGES = {
 MODELS_DIR = os.path.join(os.path.dirname(__file__), "../../../models")
 MODEL_FILE = os.path.join(MODELS_DIR, "flair-ner-german-large.pt")
 
+# The tagger is loaded once per process, the lock keeps documents processed in
+# parallel from deserializing it several times on the first call
+_MODEL = None
+_MODEL_LOCK = threading.Lock()
+
+# Background thread started by preload_model, at most one per process
+_PRELOAD_THREAD = None
+_PRELOAD_LOCK = threading.Lock()
+
 
 def download_model_if_needed():
     """Download the Hugging Face NER model if it does not exist locally."""
+    # flair pulls in torch, only import it once a model is actually needed
+    from flair.models import SequenceTagger
+
     if not os.path.exists(MODEL_FILE):
         logger.info("Downloading Hugging Face model...")
         os.makedirs(MODELS_DIR, exist_ok=True)
@@ -24,12 +35,51 @@ def download_model_if_needed():
 
 
 def load_model():
-    """Load the Hugging Face NER model from the local file."""
-    if os.path.exists(MODEL_FILE):
-        logger.info("Loading the local Hugging Face model...")
-        model = SequenceTagger.load(MODEL_FILE)
-    else:
-        logger.info("Model not found locally, downloading...")
-        download_model_if_needed()
-        model = load_model()
-    return model
+    """
+    Load the Hugging Face NER model from the local file.
+
+    The model is only loaded on the first call and shared by all later callers.
+    """
+    global _MODEL
+
+    if _MODEL is not None:
+        return _MODEL
+
+    from flair.models import SequenceTagger
+
+    with _MODEL_LOCK:
+        if _MODEL is None:
+            if not os.path.exists(MODEL_FILE):
+                logger.info("Model not found locally, downloading...")
+                download_model_if_needed()
+            logger.info("Loading the local Hugging Face model...")
+            model = SequenceTagger.load(MODEL_FILE)
+            # Inference only, predict already runs without autograd
+            model.eval()
+            _MODEL = model
+    return _MODEL
+
+
+def _preload_model():
+    """Load the NER model, logging instead of raising since nobody waits for it."""
+    try:
+        load_model()
+    except Exception as e:
+        logger.error(f"Error preloading the NER model: {e}", exc_info=True)
+
+
+def preload_model():
+    """
+    Start loading the NER model in a background thread, once per process.
+
+    The first anonymization then finds the model loaded or waits for the running
+    load in load_model, while app startup does not wait for it at all.
+    """
+    global _PRELOAD_THREAD
+
+    with _PRELOAD_LOCK:
+        if _PRELOAD_THREAD is None:
+            _PRELOAD_THREAD = threading.Thread(
+                target=_preload_model, name="ner_model_preload", daemon=True
+            )
+            _PRELOAD_THREAD.start()
@@ -1,6 +1,10 @@
+import re
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
+# Whitespace separated words, the same tokens text.split() produces
+WORD_PATTERN = re.compile(r"\S+")
+
 
 class BaseProcessor(ABC):
     """Base class for all anonymization processors."""
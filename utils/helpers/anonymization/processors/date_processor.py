@@ -2,7 +2,10 @@ import re
 from typing import Any, Dict, List
 
 from ..constants import DATE_PATTERNS, GERMAN_MONTHS, GERMAN_WEEKDAYS
-from .base import BaseProcessor
+from .base import WORD_PATTERN, BaseProcessor
+
+# Compiled once at import instead of looked up in the re cache for every text
+DATE_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in DATE_PATTERNS]
 
 
 class DateProcessor(BaseProcessor):
@@ -30,17 +33,16 @@ class DateProcessor(BaseProcessor):
 
     def _detect_split_dates(self, text: str) -> List[Dict[str, Any]]:
         """Detect dates that are split across multiple words."""
-        words = text.split()
+        # Keep the matches, they already know where each word starts
+        word_matches = list(WORD_PATTERN.finditer(text))
+        words = [match.group() for match in word_matches]
         detected = []
         i = 0
 
         while i < len(words):
             if self._is_valid_date_part(words[i]):
                 date_parts = [words[i]]
-                start_pos = text.find(
-                    words[i],
-                    0 if i == 0 else text.find(words[i - 1]) + len(words[i - 1]),
-                )
+                start_pos = word_matches[i].start()
 
                 for j in range(1, min(4, len(words) - i)):
                     if self._is_valid_date_part(words[i + j]):
@@ -82,8 +84,8 @@ class DateProcessor(BaseProcessor):
     ) -> List[Dict[str, Any]]:
         """Process the text to detect dates."""
         # Apply pattern matching for regular dates
-        for pattern in DATE_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for regex in DATE_REGEXES:
+            for match in regex.finditer(text):
                 detected_entities.append(
                     {
                         "original_word": match.group(0),
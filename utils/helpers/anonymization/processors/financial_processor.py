@@ -1,8 +1,17 @@
 import re
+from bisect import bisect_left
 from typing import Any, Dict, List
 
-from ..constants import FINANCIAL_PATTERNS
-from .base import BaseProcessor
+from ..constants import BIC_CODE_PATTERN, BIC_KEYWORD_PATTERN, FINANCIAL_PATTERNS
+from .base import WORD_PATTERN, BaseProcessor
+
+# Compiled once at import, patterns without uppercase letters match any case
+FINANCIAL_REGEXES = [
+    re.compile(pattern, 0 if any(c.isupper() for c in pattern) else re.IGNORECASE)
+    for pattern in FINANCIAL_PATTERNS
+]
+BIC_CODE_REGEX = re.compile(BIC_CODE_PATTERN)
+BIC_KEYWORD_REGEX = re.compile(BIC_KEYWORD_PATTERN)
 
 
 class FinancialProcessor(BaseProcessor):
@@ -16,19 +25,39 @@ class FinancialProcessor(BaseProcessor):
             return False
         return cleaned.isdigit() and 2 <= len(cleaned) <= 5
 
+    def _find_unlabelled_bic_codes(self, text: str) -> List[re.Match]:
+        """
+        Find BIC codes that are followed by BIC or SWIFT on the same line.
+
+        The keyword positions are collected once, so the rest of the line is not
+        scanned again for every candidate as with a lookahead.
+        """
+        keyword_starts = [match.start() for match in BIC_KEYWORD_REGEX.finditer(text)]
+        if not keyword_starts:
+            return []
+
+        matches = []
+        for match in BIC_CODE_REGEX.finditer(text):
+            index = bisect_left(keyword_starts, match.end())
+            if index == len(keyword_starts):
+                break
+            if text.find("\n", match.end(), keyword_starts[index]) == -1:
+                matches.append(match)
+
+        return matches
+
     def _detect_consecutive_numbers(self, text: str) -> List[Dict[str, Any]]:
         """Detect potential phone numbers from consecutive number-like groups."""
-        words = text.split()
+        # Keep the matches, they already know where each word starts
+        word_matches = list(WORD_PATTERN.finditer(text))
+        words = [match.group() for match in word_matches]
         detected = []
         i = 0
 
         while i < len(words):
             if self._is_potential_phone_number(words[i]):
                 number_parts = [words[i]]
-                start_pos = text.find(
-                    words[i],
-                    0 if i == 0 else text.find(words[i - 1]) + len(words[i - 1]),
-                )
+                start_pos = word_matches[i].start()
 
                 while i + 1 < len(words) and self._is_potential_phone_number(
                     words[i + 1]
@@ -58,19 +87,22 @@ class FinancialProcessor(BaseProcessor):
     ) -> List[Dict[str, Any]]:
         """Process the text to detect financial IDs and phone numbers."""
         # Use regex patterns
-        for pattern in FINANCIAL_PATTERNS:
-            flags = re.IGNORECASE if not any(c.isupper() for c in pattern) else 0
-            for match in re.finditer(pattern, text, flags=flags):
-                if any(char.isdigit() or char in "/:.-" for char in match.group(0)):
-                    detected_entities.append(
-                        {
-                            "original_word": match.group(0),
-                            "entity_type": "FINANCIAL_ID",
-                            "start": match.start(),
-                            "end": match.end(),
-                            "score": 1.0,
-                        }
-                    )
+        matches = [
+            match for regex in FINANCIAL_REGEXES for match in regex.finditer(text)
+        ]
+        matches.extend(self._find_unlabelled_bic_codes(text))
+
+        for match in matches:
+            if any(char.isdigit() or char in "/:.-" for char in match.group(0)):
+                detected_entities.append(
+                    {
+                        "original_word": match.group(0),
+                        "entity_type": "FINANCIAL_ID",
+                        "start": match.start(),
+                        "end": match.end(),
+                        "score": 1.0,
+                    }
+                )
 
         # Detect consecutive number groups
         consecutive_numbers = self._detect_consecutive_numbers(text)
@@ -1,7 +1,7 @@
 from typing import Any, Dict, List
 
 from ..constants import GENDER_WORDS
-from .base import BaseProcessor
+from .base import WORD_PATTERN, BaseProcessor
 
 
 class GenderProcessor(BaseProcessor):
@@ -11,23 +11,22 @@ class GenderProcessor(BaseProcessor):
         self, text: str, detected_entities: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Process the text to detect gender words."""
-        words = []
-        index = 0
+        lowered_text = text.lower()
+        # A few rare characters change length when lowercased, offsets into the
+        # lowered text then no longer match the original and words are lowered
+        # one by one instead
+        aligned = len(lowered_text) == len(text)
 
-        for word in text.split():
-            start_idx = text.index(word, index)
-            words.append((word, start_idx))
-            index = start_idx + len(word)
-
-        for word, start_idx in words:
-            normalized_word = word.lower().strip(",.!?;:")
-            if normalized_word in GENDER_WORDS:
+        for match in WORD_PATTERN.finditer(lowered_text if aligned else text):
+            normalized_word = match.group() if aligned else match.group().lower()
+            if normalized_word.strip(",.!?;:") in GENDER_WORDS:
+                word = text[match.start() : match.end()]
                 detected_entities.append(
                     {
                         "original_word": word,
                         "entity_type": "GENDER_WORD",
-                        "start": start_idx,
-                        "end": start_idx + len(word),
+                        "start": match.start(),
+                        "end": match.end(),
                         "score": 1.0,
                     }
                 )
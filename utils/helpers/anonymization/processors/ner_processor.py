@@ -1,47 +1,84 @@
+import os
+import threading
 from typing import Any, Dict, List
 
-from flair.data import Sentence
-
 from ..constants import PRESIDIO_EQUIVALENCES, WHITELIST
 from ..models import load_model
 from .base import BaseProcessor
 
+# Number of sentences Flair embeds and tags together in one forward pass
+NER_MINI_BATCH_SIZE = 32
+
+# Texts shorter than this are left to the pattern based processors, 0 always runs NER
+MIN_NER_CHARS = int(os.getenv("QODIA_MIN_NER_CHARS", "0"))
+
+# The tagger is shared by all threads, but its tokenizer must not be used
+# concurrently, so predictions run one at a time
+PREDICT_LOCK = threading.Lock()
+
 
 class NERProcessor(BaseProcessor):
     """Processor for Named Entity Recognition using Flair."""
 
     def __init__(self, threshold: float = 0.7):
+        from flair.splitter import SegtokSentenceSplitter
+
         self.threshold = threshold
         self.model = load_model()
+        self.splitter = SegtokSentenceSplitter()
 
     def process(
         self, text: str, detected_entities: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Process the text using Flair NER model."""
-        sentence = Sentence(text)
-        self.model.predict(sentence)
+        # Skip the model for configured short texts and texts without any letters
+        if len(text.strip()) < MIN_NER_CHARS or not any(
+            char.isalpha() for char in text
+        ):
+            return detected_entities
 
-        # Add NER detected entities from Flair
-        for entity in sentence.get_spans("ner"):
-            # Skip single-character entities and whitelisted terms
-            if (
-                len(entity.text.strip()) <= 1
-                or entity.text.lower().strip() in WHITELIST
-            ):
-                continue
-
-            presidio_entity_type = PRESIDIO_EQUIVALENCES.get(
-                entity.get_label("ner").value
+        import flair
+        import torch
+
+        # Tag sentence by sentence so Flair can batch them instead of pushing
+        # the whole document through the model as one sequence
+        sentences = self.splitter.split(text)
+
+        # On a GPU the transformer runs in half precision, the weights stay in
+        # FP32 so numerically sensitive ops are still computed in full precision
+        with PREDICT_LOCK, torch.inference_mode(), torch.autocast(
+            device_type=flair.device.type,
+            dtype=torch.float16,
+            enabled=flair.device.type == "cuda",
+        ):
+            self.model.predict(
+                sentences,
+                mini_batch_size=NER_MINI_BATCH_SIZE,
+                embedding_storage_mode="none",
             )
-            if presidio_entity_type and entity.score > self.threshold:
-                detected_entities.append(
-                    {
-                        "original_word": entity.text,
-                        "entity_type": presidio_entity_type,
-                        "start": entity.start_position,
-                        "end": entity.end_position,
-                        "score": entity.score,
-                    }
+
+        # Add NER detected entities from Flair
+        for sentence in sentences:
+            for entity in sentence.get_spans("ner"):
+                # Skip single-character entities and whitelisted terms
+                if (
+                    len(entity.text.strip()) <= 1
+                    or entity.text.lower().strip() in WHITELIST
+                ):
+                    continue
+
+                presidio_entity_type = PRESIDIO_EQUIVALENCES.get(
+                    entity.get_label("ner").value
                 )
+                if presidio_entity_type and entity.score > self.threshold:
+                    detected_entities.append(
+                        {
+                            "original_word": entity.text,
+                            "entity_type": presidio_entity_type,
+                            "start": sentence.start_position + entity.start_position,
+                            "end": sentence.start_position + entity.end_position,
+                            "score": entity.score,
+                        }
+                    )
 
         return detected_entities
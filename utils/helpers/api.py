@@ -1,18 +1,24 @@
-import http.client
 import json
 import os
 import pickle
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from http.cookiejar import DefaultCookiePolicy
 from io import BytesIO
-from typing import Dict, List, Optional, Union
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import requests
 import streamlit as st
 from jinja2 import Environment, FileSystemLoader
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from streamlit.runtime.uploaded_file_manager import UploadedFile
+from urllib3.util import Retry
 
 from utils.helpers.document_store import get_document_store
 from utils.helpers.logger import logger
@@ -21,6 +27,28 @@ from utils.helpers.transform import df_to_items, format_ziffer_to_4digits
 DEPLOYMENT_ENV = os.getenv("DEPLOYMENT_ENV", "local")
 USE_CACHE = os.getenv("USE_CACHE", "true").lower() == "true"
 
+# Compiled templates are kept by the environment, auto_reload=False also skips
+# the stat() of the template file on every invoice
+TEMPLATE_ENV = Environment(loader=FileSystemLoader("."), auto_reload=False)
+
+# Item fields of the invoice that are displayed as currency
+CURRENCY_FIELDS = frozenset(("preis", "total"))
+
+# Shared session so repeated API and PDF requests reuse pooled TLS connections.
+# Headers stay per request and no cookies are kept, the session is shared by
+# all Streamlit sessions and each of them has its own API key.
+API_SESSION = requests.Session()
+API_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+API_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        # Only idempotent requests like the GETs are retried, never the POSTs
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    ),
+)
+
 
 def check_if_default_credentials() -> None:
     """
@@ -49,7 +77,7 @@ def get_workflows() -> List[str]:
     headers = {"x-api-key": st.session_state.api_key}
 
     try:
-        response = requests.get(url, headers=headers)
+        response = API_SESSION.get(url, headers=headers)
         logger.info(
             f"Done retrieving workflows. Response status: {response.status_code}"
         )
@@ -150,10 +178,10 @@ def analyze_api_call(
         if file:
             # Send as multipart/form-data with file
             files = {"file": ("document.pdf", file, "application/pdf")}
-            response = requests.post(url, headers=headers, data=payload, files=files)
+            response = API_SESSION.post(url, headers=headers, data=payload, files=files)
         else:
             # Send as form-data without file
-            response = requests.post(url, headers=headers, data=payload)
+            response = API_SESSION.post(url, headers=headers, data=payload)
 
         # Store headers for later use
         analyze_api_call.last_response_headers = dict(response.headers)
@@ -271,7 +299,7 @@ def ocr_pdf_to_text_api(
     files = {"file": (file_name, file_bytes, mime_type)}
 
     try:
-        response = requests.post(url, headers=headers, data=payload, files=files)
+        response = API_SESSION.post(url, headers=headers, data=payload, files=files)
     except Exception as e:
         logger.error(f"Error calling API for OCR: {e}", exc_info=True)
         raise
@@ -346,7 +374,7 @@ def send_feedback_api(response_object: Dict) -> None:
     }
 
     try:
-        response = requests.post(url, headers=headers, data=payload)
+        response = API_SESSION.post(url, headers=headers, data=payload)
         logger.info(f"Feedback sent. Response status: {response.status_code}")
         if response.status_code != 200:
             logger.error(f"API Feedback error: {response.text}")
@@ -356,15 +384,25 @@ def send_feedback_api(response_object: Dict) -> None:
         raise
 
 
-def generate_pdf_from_df(df: Optional[pd.DataFrame] = None) -> str:
+def _format_currency(value: float) -> str:
+    # Two decimals with a decimal comma, e.g. "10,72 €"
+    return f"{value:.2f} €".replace(".", ",")
+
+
+def generate_pdf_from_df(
+    df: Optional[pd.DataFrame] = None, buffer: Optional[BinaryIO] = None
+) -> Optional[str]:
     """
     Generate a PDF file from the given DataFrame, taking into account any applicable discount.
 
     Args:
         df (Optional[pd.DataFrame]): The DataFrame containing the data for the PDF.
+        buffer (Optional[BinaryIO]): If given, the PDF is written into this buffer
+            instead of a file on disk.
 
     Returns:
-        str: The path to the generated PDF file.
+        Optional[str]: The path to the generated PDF file, or None if the PDF was
+        written into the buffer.
     """
     data = {
         "customer_name": "Max Mustermann",
@@ -403,27 +441,25 @@ def generate_pdf_from_df(df: Optional[pd.DataFrame] = None) -> str:
         data["final_price"] = data["total"]
         data["discount_reason"] = None  # No discount reason
 
-    # Format items' values for currency display
+    # Format items' values for display in one pass, currency only for the prices
     for item in data["items"]:
         for key, value in item.items():
-            if isinstance(value, (int, float)):
-                if key in ["preis", "total"]:
-                    item[key] = f"{value:.2f} €".replace(".", ",")
-                else:
-                    item[key] = str(value)
+            if key in CURRENCY_FIELDS:
+                item[key] = _format_currency(value)
+            elif isinstance(value, (int, float)):
+                item[key] = str(value)
         item["ziffer"] = format_ziffer_to_4digits(item["ziffer"])
         if int(item["anzahl"]) > 1:
             item["ziffer"] = f"{item['anzahl']}x {item['ziffer']}"
 
     # Format total, discount, and final price
-    data["total"] = f"{data['total']:.2f} €".replace(".", ",")
+    data["total"] = _format_currency(data["total"])
     if data["discount"] is not None:
-        data["discount"] = f"{data['discount']:.2f} €".replace(".", ",")
-    data["final_price"] = f"{data['final_price']:.2f} €".replace(".", ",")
+        data["discount"] = _format_currency(data["discount"])
+    data["final_price"] = _format_currency(data["final_price"])
 
     # Render the HTML content using the template
-    env = Environment(loader=FileSystemLoader("."))
-    template = env.get_template("./data/template_rechnung.html")
+    template = TEMPLATE_ENV.get_template("./data/template_rechnung.html")
     html_content = template.render(data)
 
     # Save HTML to file
@@ -432,7 +468,6 @@ def generate_pdf_from_df(df: Optional[pd.DataFrame] = None) -> str:
 
     # Generate PDF via API
     pdf_file = "./data/rechnung_generiert.pdf"
-    conn = http.client.HTTPSConnection("yakpdf.p.rapidapi.com")
 
     payload = {
         "pdf": {
@@ -458,14 +493,19 @@ def generate_pdf_from_df(df: Optional[pd.DataFrame] = None) -> str:
         "x-rapidapi-host": "yakpdf.p.rapidapi.com",
     }
 
-    conn.request("POST", "/pdf", json.dumps(payload).encode("utf-8"), headers)
-    res = conn.getresponse()
-    data = res.read()
+    # Stream the PDF into the buffer or file instead of holding the whole
+    # response in memory first. The file is only opened once the API answered
+    # successfully, so a failed request leaves the previous PDF untouched.
+    with API_SESSION.post(
+        "https://yakpdf.p.rapidapi.com/pdf", json=payload, headers=headers, stream=True
+    ) as response:
+        response.raise_for_status()
+        target = nullcontext(buffer) if buffer is not None else open(pdf_file, "wb")
+        with target as file:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                file.write(chunk)
 
-    with open(pdf_file, "wb") as file:
-        file.write(data)
-
-    return pdf_file
+    return None if buffer is not None else pdf_file
 
 
 def generate_pdf(df: pd.DataFrame) -> bytes:
@@ -478,10 +518,10 @@ def generate_pdf(df: pd.DataFrame) -> bytes:
     Returns:
         bytes: The generated PDF file as bytes.
     """
-    pdf_file_path = generate_pdf_from_df(df)
-    with open(pdf_file_path, "rb") as file:
-        pdf_data = file.read()
-    return pdf_data
+    # Keep the PDF in memory instead of writing it to disk and reading it back
+    buffer = BytesIO()
+    generate_pdf_from_df(df, buffer=buffer)
+    return buffer.getvalue()
 
 
 def test_api() -> bool:
@@ -495,7 +535,7 @@ def test_api() -> bool:
     headers = {"x-api-key": st.session_state.api_key}
 
     try:
-        response = requests.get(url, headers=headers)
+        response = API_SESSION.get(url, headers=headers)
         if response.status_code == 401:
             logger.error("API authentication failed: Incorrect API key")
             st.error(
@@ -533,3 +573,58 @@ def test_api() -> bool:
 
     st.session_state.api_key_tested = True
     return True
+
+
+@st.cache_resource(show_spinner=False)
+def cached_test_api(api_key: str, api_url: str) -> bool:
+    """
+    Process-wide cached variant of test_api(), keyed on the credentials being tested.
+
+    Args:
+        api_key (str): The API key, used as cache key.
+        api_url (str): The API URL, used as cache key.
+
+    Returns:
+        bool: True if the API settings are correct, False otherwise.
+    """
+    return test_api()
+
+
+@st.cache_resource(show_spinner=False)
+def cached_get_workflows(api_key: str, api_url: str) -> List[str]:
+    """
+    Process-wide cached variant of get_workflows(), keyed on the credentials used.
+
+    Args:
+        api_key (str): The API key, used as cache key.
+        api_url (str): The API URL, used as cache key.
+
+    Returns:
+        List[str]: The list of available workflows.
+    """
+    return get_workflows()
+
+
+def probe_api(api_key: str, api_url: str) -> Tuple[bool, List[str]]:
+    """
+    Test the API settings and retrieve the workflows concurrently.
+
+    Both requests are independent, so they are issued from two worker threads
+    that share the current script run context (needed for st.error and the
+    session state access inside the wrapped helpers).
+
+    Args:
+        api_key (str): The API key, used as cache key.
+        api_url (str): The API URL, used as cache key.
+
+    Returns:
+        Tuple[bool, List[str]]: Whether the API test succeeded and the available workflows.
+    """
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=2,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    ) as executor:
+        api_ok = executor.submit(cached_test_api, api_key, api_url)
+        workflows = executor.submit(cached_get_workflows, api_key, api_url)
+        return api_ok.result(), workflows.result()
@@ -5,6 +5,31 @@ import streamlit as st
 
 from utils.helpers.logger import logger
 
+# Columns of the GOA CSV holding factors and prices as decimal comma strings
+GOA_FACTOR_COLUMNS = ("Einfachfaktor", "Regelhöchstfaktor", "Höchstfaktor")
+GOA_PRICE_COLUMNS = ("Einfachsatz", "Regelhöchstsatz", "Höchstsatz")
+
+
+def _parse_decimal_column(column: pd.Series) -> pd.Series:
+    # Replace "-" with None and parse the decimal comma
+    return column.replace("-", None).str.replace(",", ".").astype(float)
+
+
+@st.cache_data
+def _read_goa_csv(path: str) -> pd.DataFrame:
+    # Parsed once per path, the full and the processed variant both start from it
+    logger.info(f"Reading GOA data from {path}")
+
+    try:
+        # Read in the csv file with pandas
+        return pd.read_csv(path, sep=";", encoding="utf-8", encoding_errors="replace")
+    except FileNotFoundError:
+        logger.error(f"GOA file not found at {path}")
+        raise
+    except pd.errors.EmptyDataError:
+        logger.error(f"GOA file at {path} is empty")
+        raise
+
 
 @st.cache_data
 def read_in_goa(
@@ -28,17 +53,7 @@ def read_in_goa(
         FileNotFoundError: If the specified file is not found.
         pd.errors.EmptyDataError: If the CSV file is empty.
     """
-    logger.info(f"Reading GOA data from {path}")
-
-    try:
-        # Read in the csv file with pandas
-        goa = pd.read_csv(path, sep=";", encoding="utf-8", encoding_errors="replace")
-    except FileNotFoundError:
-        logger.error(f"GOA file not found at {path}")
-        raise
-    except pd.errors.EmptyDataError:
-        logger.error(f"GOA file at {path} is empty")
-        raise
+    goa = _read_goa_csv(path)
 
     if fully:
         logger.info("Returning full GOA DataFrame")
@@ -66,21 +81,8 @@ def read_in_goa(
     # goa = goa.dropna()
 
     # Cast type of "Einfachfaktor", "Einachsatz", "Regelhöchstfaktor", "Regelhöchstsatz", "Höchstfaktor", "Höchstsatz" to float
-    # Replace "-" with None
-    goa["Einfachfaktor"] = goa["Einfachfaktor"].replace("-", None)
-    goa["Einfachfaktor"] = goa["Einfachfaktor"].str.replace(",", ".").astype(float)
-    goa["Einfachsatz"] = goa["Einfachsatz"].replace("-", None)
-    goa["Einfachsatz"] = goa["Einfachsatz"].str.replace(",", ".").astype(float)
-    goa["Regelhöchstfaktor"] = goa["Regelhöchstfaktor"].replace("-", None)
-    goa["Regelhöchstfaktor"] = (
-        goa["Regelhöchstfaktor"].str.replace(",", ".").astype(float)
-    )
-    goa["Regelhöchstsatz"] = goa["Regelhöchstsatz"].replace("-", None)
-    goa["Regelhöchstsatz"] = goa["Regelhöchstsatz"].str.replace(",", ".").astype(float)
-    goa["Höchstfaktor"] = goa["Höchstfaktor"].replace("-", None)
-    goa["Höchstfaktor"] = goa["Höchstfaktor"].str.replace(",", ".").astype(float)
-    goa["Höchstsatz"] = goa["Höchstsatz"].replace("-", None)
-    goa["Höchstsatz"] = goa["Höchstsatz"].str.replace(",", ".").astype(float)
+    for column in GOA_FACTOR_COLUMNS + GOA_PRICE_COLUMNS:
+        goa[column] = _parse_decimal_column(goa[column])
 
     # For every row in the DataFrame add a new row with the same values but the GOÄZiffer with an " A" at the end
     # Replace the Beschreibung with the text "Analogziffer zu " + original GO'Ziffer
@@ -103,6 +105,34 @@ def read_in_goa(
     return goa
 
 
+@st.cache_data
+def read_in_goa_index(
+    path: str = "./data/GOA_Ziffern.csv", fully: bool = False
+) -> pd.DataFrame:
+    """
+    Read the GOA data indexed by GOÄZiffer for repeated lookups.
+
+    Looking up a Ziffer with .loc on the index is a hash lookup instead of
+    comparing the whole GOÄZiffer column for every row. The factor and price
+    columns are floats in both variants.
+
+    Args:
+        path (str): The file path to the GOA CSV file. Defaults to "./data/GOA_Ziffern.csv".
+        fully (bool): If True, index the full DataFrame. If False, index the processed subset.
+                      Defaults to False.
+
+    Returns:
+        pd.DataFrame: The GOA data indexed by GOÄZiffer, the column itself is kept.
+    """
+    goa = read_in_goa(path, fully=fully)
+    if fully:
+        # The processed variant has floats already, parse factors and prices
+        # of the full one once here instead of for every billing item
+        for column in GOA_FACTOR_COLUMNS + GOA_PRICE_COLUMNS:
+            goa[column] = _parse_decimal_column(goa[column])
+    return goa.set_index("GOÄZiffer", drop=False)
+
+
 def get_goa_description(goa_number: str, goa_df: Optional[pd.DataFrame] = None) -> str:
     """
     Retrieve the description for a given GOA number.
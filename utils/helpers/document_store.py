@@ -434,11 +434,16 @@ class DocumentStore:
             return ""
 
 
+@st.cache_resource(show_spinner=False)
+def get_cached_document_store(api_key: str) -> DocumentStore:
+    """Create the DocumentStore for an api_key once and reuse it across reruns."""
+    return DocumentStore(api_key)
+
+
 def get_document_store(api_key: Optional[str] = None) -> DocumentStore:
     """Get or create a DocumentStore instance."""
-    # Create a fresh instance each time
     if api_key is not None:
-        return DocumentStore(api_key)
+        return get_cached_document_store(api_key)
     if "document_store" not in st.session_state:
         st.session_state.document_store = DocumentStore(st.session_state.api_key)
     return st.session_state.document_store
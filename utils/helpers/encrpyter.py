@@ -1,37 +1,112 @@
 import hashlib
 import os
+import threading
 import zipfile
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Dict, Tuple
 
 from cryptography import x509
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 from utils.helpers.logger import logger
 
+# Size of the blocks that files are streamed through the AES cipher in
+CHUNK_SIZE = 1 << 20
+
+# File types whose content is compressed already and gets stored as-is in zips
+PRECOMPRESSED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".zip", ".p7m")
+
+# Leads files encrypted with AES-CTR, older files start with the key length and
+# are decrypted with AES-CFB
+CTR_FORMAT_MAGIC = b"QCTR"
+
+# Per-thread input and output buffers of stream_cipher
+_buffers = threading.local()
+
 
 def calculate_sha1(filename):
-    sha1 = hashlib.sha1()
+    # file_digest runs the read/update loop in C instead of per chunk in Python
     with open(filename, "rb") as f:
-        while True:
-            data = f.read(65536)  # Read in 64kb chunks
-            if not data:
-                break
-            sha1.update(data)
-    return sha1.hexdigest()
+        return hashlib.file_digest(f, "sha1").hexdigest()
+
+
+def _cipher_buffers(chunk_size: int) -> Tuple[bytearray, bytearray]:
+    # Streamlit serves sessions from several threads, so buffers can't be shared
+    buffers = getattr(_buffers, "by_size", None)
+    if buffers is None:
+        buffers = _buffers.by_size = {}
+    if chunk_size not in buffers:
+        # update_into needs room for one block more than the input
+        buffers[chunk_size] = (
+            bytearray(chunk_size),
+            bytearray(chunk_size + algorithms.AES.block_size // 8 - 1),
+        )
+    return buffers[chunk_size]
+
+
+def stream_cipher(fin, fout, cipher_context, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Stream a file through an AES cipher context in fixed-size blocks.
+
+    Only one block of plain and cipher text is held in memory at a time. The
+    buffers are kept per thread and reused for every block and every file.
+
+    Args:
+        fin: Binary file object to read from.
+        fout: Binary file object to write the result to.
+        cipher_context: Encryptor or decryptor of a cryptography Cipher.
+        chunk_size (int): Number of bytes to process per block.
+    """
+    buf, out = _cipher_buffers(chunk_size)
+    buf_view = memoryview(buf)
+    out_view = memoryview(out)
+
+    while n := fin.readinto(buf):
+        written = cipher_context.update_into(buf_view[:n], out)
+        fout.write(out_view[:written])
+    fout.write(cipher_context.finalize())
+
+
+def compress_files(files, output_zip) -> Dict[str, Tuple[int, str]]:
+    """
+    Compress files into a zip archive, hashing them in the same pass.
 
+    Every file is read once, each block is fed to SHA-1 and to the compressor,
+    so the PADnext checksums don't need a second read of the files. Files that
+    are compressed already, like images, are stored instead of deflated.
 
-def compress_files(files, output_zip):
+    Args:
+        files: Paths of the files to compress.
+        output_zip: Path of the zip archive to create.
+
+    Returns:
+        Dict[str, Tuple[int, str]]: Size and SHA-1 hex digest per file path.
+    """
+    digests = {}
     with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
         for file in files:
-            zipf.write(file, os.path.basename(file))
+            zinfo = zipfile.ZipInfo.from_file(file, os.path.basename(file))
+            # Deflating already compressed formats costs CPU time for no gain
+            zinfo.compress_type = (
+                zipfile.ZIP_STORED
+                if file.lower().endswith(PRECOMPRESSED_EXTENSIONS)
+                else zipfile.ZIP_DEFLATED
+            )
+            sha1 = hashlib.sha1()
+            size = 0
+            with open(file, "rb") as fin, zipf.open(zinfo, "w") as fout:
+                while chunk := fin.read(CHUNK_SIZE):
+                    sha1.update(chunk)
+                    fout.write(chunk)
+                    size += len(chunk)
+            digests[file] = (size, sha1.hexdigest())
+    return digests
 
 
 def encrypt_file(input_file, output_file, public_key):
-    with open(input_file, "rb") as f:
-        data = f.read()
-
     # Generate a random AES key
     aes_key = os.urandom(32)
 
@@ -45,57 +120,79 @@ def encrypt_file(input_file, output_file, public_key):
         ),
     )
 
-    # Generate a random IV
+    # Generate a random nonce for the counter blocks
     iv = os.urandom(16)
 
-    # Encrypt the data with AES
-    cipher = Cipher(algorithms.AES(aes_key), modes.CFB(iv), backend=default_backend())
+    # Encrypt the data with AES in CTR mode, whose blocks are independent
+    cipher = Cipher(algorithms.AES(aes_key), modes.CTR(iv))
     encryptor = cipher.encryptor()
-    encrypted_data = encryptor.update(data) + encryptor.finalize()
 
-    # Write the encrypted data to the output file
-    with open(output_file, "wb") as f:
-        f.write(len(encrypted_key).to_bytes(4, byteorder="big"))
-        f.write(encrypted_key)
-        f.write(iv)
-        f.write(encrypted_data)
+    # Write the header and stream the encrypted data to the output file
+    with open(input_file, "rb") as fin, open(output_file, "wb") as fout:
+        fout.write(CTR_FORMAT_MAGIC)
+        fout.write(len(encrypted_key).to_bytes(4, byteorder="big"))
+        fout.write(encrypted_key)
+        fout.write(iv)
+        stream_cipher(fin, fout, encryptor)
+
+
+@lru_cache(maxsize=4)
+def _read_private_key(path: str, mtime: float):
+    # mtime is part of the cache key, so a replaced key file is read again
+    with open(path, "rb") as key_file:
+        return serialization.load_pem_private_key(key_file.read(), password=None)
+
+
+@lru_cache(maxsize=4)
+def _read_public_key(path: str, mtime: float):
+    with open(path, "rb") as key_file:
+        return serialization.load_pem_public_key(key_file.read())
 
 
 def load_private_key(serial_number: str = None):
-    # Load the private key
-    with open("ssl/private_key.pem", "rb") as key_file:
-        private_key = serialization.load_pem_private_key(
-            key_file.read(), password=None, backend=default_backend()
-        )
-    return private_key
+    # Load the private key, parsed keys are reused until the file changes
+    path = "ssl/private_key.pem"
+    return _read_private_key(path, os.path.getmtime(path))
 
 
 def load_certificate(serial_number: str = None):
     # Load the certificate
     with open("ssl/certificate.pem", "rb") as cert_file:
-        cert = x509.load_pem_x509_certificate(cert_file.read(), default_backend())
+        cert = x509.load_pem_x509_certificate(cert_file.read())
     return cert
 
 
 def load_public_key(serial_number: str = None):
     """Load the public key for encryption."""
     try:
-        with open("ssl/public_key.pem", "rb") as key_file:
-            return serialization.load_pem_public_key(
-                key_file.read(), backend=default_backend()
-            )
+        path = "ssl/public_key.pem"
+        return _read_public_key(path, os.path.getmtime(path))
     except Exception as e:
         logger.error(f"Error loading public key: {e}", exc_info=True)
         raise
 
 
 def decrypt_file(input_file, output_file, private_key):
-    with open(input_file, "rb") as f:
+    # output_file may be a path or an open binary file object, e.g. a temp file
+    if isinstance(output_file, (str, os.PathLike)):
+        output = open(output_file, "wb")
+    else:
+        output = nullcontext(output_file)
+
+    with open(input_file, "rb") as fin, output as fout:
+        # Files without the CTR marker were written with AES-CFB
+        header = fin.read(4)
+        if header == CTR_FORMAT_MAGIC:
+            mode = modes.CTR
+            header = fin.read(4)
+        else:
+            mode = modes.CFB
+
         # Read the encrypted key length
-        key_length = int.from_bytes(f.read(4), byteorder="big")
+        key_length = int.from_bytes(header, byteorder="big")
 
         # Read and decrypt the AES key
-        encrypted_key = f.read(key_length)
+        encrypted_key = fin.read(key_length)
         aes_key = private_key.decrypt(
             encrypted_key,
             padding.OAEP(
@@ -106,16 +203,9 @@ def decrypt_file(input_file, output_file, private_key):
         )
 
         # Read the IV
-        iv = f.read(16)
-
-        # Read the encrypted data
-        encrypted_data = f.read()
-
-    # Decrypt the data with AES
-    cipher = Cipher(algorithms.AES(aes_key), modes.CFB(iv), backend=default_backend())
-    decryptor = cipher.decryptor()
-    decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
+        iv = fin.read(16)
 
-    # Write the decrypted data to the output file
-    with open(output_file, "wb") as f:
-        f.write(decrypted_data)
+        # Decrypt the remaining data with AES and stream it to the output file
+        cipher = Cipher(algorithms.AES(aes_key), mode(iv))
+        decryptor = cipher.decryptor()
+        stream_cipher(fin, fout, decryptor)
@@ -1,27 +1,53 @@
 import os
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, Union
 
 from streamlit.proto.Common_pb2 import FileURLs
 from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
 
 
 # Helper function to extract .zip file and return the list of files in the directory
-def extract_zip(zip_path: Path, destination: Path) -> list:
+def extract_zip(zip_path: Union[Path, BinaryIO], destination: Path) -> list:
     """
     Extracts the contents of a zip file to a specified destination directory.
 
+    Top-level members are inflated in parallel threads, zlib releases the GIL
+    while decompressing and zipfile serialises the raw reads on the shared
+    handle. Members in subdirectories are extracted one by one so that no two
+    threads create the same directory.
+
     Args:
-        zip_path (Path): The path to the zip file to be extracted.
+        zip_path (Union[Path, BinaryIO]): The path to the zip file to be extracted,
+            or a seekable binary file object containing it.
         destination (Path): The path to the directory where the contents will be extracted.
 
     Returns:
         list: A list of filenames in the destination directory after extraction.
     """
+    # Created up front, the parallel extracts would otherwise race to create it
+    os.makedirs(destination, exist_ok=True)
+
     with zipfile.ZipFile(zip_path, "r") as zip_ref:
-        zip_ref.extractall(destination)
+        members = zip_ref.namelist()
+        nested = [m for m in members if "/" in m or "\\" in m]
+        for member in nested:
+            zip_ref.extract(member, destination)
+
+        top_level = [m for m in members if m not in nested]
+        if len(top_level) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(top_level), 8)) as executor:
+                list(
+                    executor.map(
+                        lambda member: zip_ref.extract(member, destination),
+                        top_level,
+                    )
+                )
+        elif top_level:
+            zip_ref.extract(top_level[0], destination)
+
     return os.listdir(destination)
 
 
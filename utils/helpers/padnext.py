@@ -1,4 +1,5 @@
 import os
+import tempfile
 import zipfile
 from io import StringIO
 from pathlib import Path
@@ -21,7 +22,6 @@ from schemas.padnext_v2_py.padx_basis_v2_12 import (  # Replace this with the ap
     HumanmedizinTyp,
 )
 from utils.helpers.encrpyter import (
-    calculate_sha1,
     compress_files,
     decrypt_file,
     encrypt_file,
@@ -39,6 +39,7 @@ from utils.helpers.transform import (
 from utils.helpers.xml import (
     process_xml,
     read_xml_file,
+    read_xml_string_to_object,
     read_xml_to_object,
     write_object_to_xml,
 )
@@ -51,6 +52,9 @@ SCHEMA_DIR = "schemas/padnext_v2"
 AUF_XSD_PATH = f"{SCHEMA_DIR}/padx_auf_v2.12.xsd"
 PADX_XSD_PATH = f"{SCHEMA_DIR}/padx_adl_v2.12.xsd"
 
+# Decrypted archives up to this size are kept in memory, larger ones on disk
+DECRYPT_SPOOL_SIZE = 256 * 1024 * 1024
+
 
 def generate_file_name(auftrag: Auftrag) -> str:
     return f"{format_kundennummer(auftrag.absender.logisch.kundennr)}_{format_erstellungsdatum(auftrag.erstellungsdatum)}_{auftrag.nachrichtentyp.value._value_}_{format_transfernummer(auftrag.transfernr)}"
@@ -184,7 +188,7 @@ def handle_padnext_upload(file_upload: UploadedFile) -> Path:
     )
 
     # Step 4: Deserialize XML to Auftrag object
-    auftrag: Auftrag = read_xml_to_object(auf_xml_path, Auftrag)
+    auftrag: Auftrag = read_xml_string_to_object(auf_xml_content, Auftrag)
 
     # Step 5: Handle different encryption methods
     if auftrag.verschluesselung.verfahren == VerschluesselungVerfahren.VALUE_0:
@@ -201,11 +205,14 @@ def handle_padnext_upload(file_upload: UploadedFile) -> Path:
         padx_p7m_path = temp_dir / padx_p7m_file
         private_key = load_private_key()
 
-        decrypted_zip = temp_dir / "decrypted.zip"
-        decrypt_file(padx_p7m_path, decrypted_zip, private_key)
+        # Decrypt into memory, large archives spill over into a temp file, so
+        # the decrypted zip isn't written to and read back from the folder
+        with tempfile.SpooledTemporaryFile(max_size=DECRYPT_SPOOL_SIZE) as decrypted:
+            decrypt_file(padx_p7m_path, decrypted, private_key)
+            decrypted.seek(0)
 
-        # Extract the decrypted zip file
-        extracted_files = extract_zip(decrypted_zip, temp_dir)
+            # Extract the decrypted zip file
+            extracted_files = extract_zip(decrypted, temp_dir)
 
     else:
         raise ValueError("Invalid encryption method specified in _auf.xml file.")
@@ -213,24 +220,15 @@ def handle_padnext_upload(file_upload: UploadedFile) -> Path:
     # Step 6: Process _padx.xml and validate its contents
     padx_file = next(f for f in extracted_files if f.endswith("_padx.xml"))
     padx_xml_path = temp_dir / padx_file
-    padx_xml_content = process_xml(
-        padx_xml_path, validate_padx, "Validation failed for _padx.xml file."
-    )
+    process_xml(padx_xml_path, validate_padx, "Validation failed for _padx.xml file.")
 
     # Step 7: Validate filenames match
     validate_filenames_match(auf_xml_path, padx_xml_path)
 
-    # Step 8: Validate _auf and _padx schemas
-    if not validate_auf(auf_xml_content):
-        raise ValueError("Validation failed for _auf.xml file.")
-
-    if not validate_padx(padx_xml_content):
-        raise ValueError("Validation failed for _padx.xml file.")
-
-    # Step 9: Validate if all files listed in _auf.xml are present
+    # Step 8: Validate if all files listed in _auf.xml are present
     validate_all_files_present(auftrag, temp_dir)
 
-    # Step 10: Return the path to the extracted folder
+    # Step 9: Return the path to the extracted folder
     return temp_dir
 
 
@@ -344,9 +342,7 @@ def padnext_encrypt(
 
     try:
         # Load _auf.xml into an Auftrag object
-        auftrag: Auftrag = read_xml_to_object(
-            os.path.join(input_folder, auf_file), Auftrag
-        )
+        auftrag: Auftrag = read_xml_string_to_object(xml_content, Auftrag)
 
         # Modify 'verschluesselung' based on the encryption flag
         if encrypt:
@@ -381,6 +377,7 @@ def padnext_encrypt(
 
     # Update file information and compress files
     files_to_encrypt = []
+    dateien = []
     try:
         for datei in auftrag.datei:
             file_path = os.path.join(input_folder, datei.name)
@@ -403,12 +400,8 @@ def padnext_encrypt(
 
                 datei.name = os.path.basename(file_path)
 
-            file_size = os.path.getsize(file_path)
-            checksum = calculate_sha1(file_path)
-
-            datei.dateilaenge.laenge = file_size
-            datei.dateilaenge.pruefsumme = checksum
-
+            # Size and checksum are filled in while compressing below
+            dateien.append(datei)
             files_to_encrypt.append(file_path)
     except FileNotFoundError:
         # If any file is missing, recreate the datei list in the Auftrag object
@@ -416,13 +409,8 @@ def padnext_encrypt(
             if file.endswith(".pdf", ".png", ".jpg", ".tiff"):
                 datei = DateiTyp()
                 datei.name = file
-                datei.dateilaenge.laenge = os.path.getsize(
-                    os.path.join(input_folder, file)
-                )
-                datei.dateilaenge.pruefsumme = calculate_sha1(
-                    os.path.join(input_folder, file)
-                )
                 auftrag.datei.append(datei)
+                dateien.append(datei)
                 files_to_encrypt.append(os.path.join(input_folder, file))
             elif file.endswith("_padx.xml"):
                 new_file_name = os.path.join(
@@ -437,16 +425,17 @@ def padnext_encrypt(
 
                 datei = DateiTyp()
                 datei.name = os.path.basename(file_path)
-                datei.dateilaenge.laenge = os.path.getsize(file_path)
-                datei.dateilaenge.pruefsumme = calculate_sha1(file_path)
                 auftrag.datei.append(datei)
+                dateien.append(datei)
                 files_to_encrypt.append(file_path)
 
-    # Compress files into a .zip archive
+    # Compress files into a .zip archive, hashing them in the same pass
     compressed_file = os.path.join(
         output_folder, f"{generate_file_name(auftrag=auftrag)}_dat_padx.zip"
     )
-    compress_files(files_to_encrypt, compressed_file)
+    digests = compress_files(files_to_encrypt, compressed_file)
+    for datei, file_path in zip(dateien, files_to_encrypt):
+        datei.dateilaenge.laenge, datei.dateilaenge.pruefsumme = digests[file_path]
 
     logger.info(f"Files to encrypt: {files_to_encrypt}")
 
@@ -480,9 +469,13 @@ def padnext_encrypt(
             zipf.write(
                 os.path.join(output_folder, auf_file), auf_file
             )  # Add modified _auf.xml to zip
+            # Add encrypted or unencrypted file to zip, both are a compressed
+            # .zip already, so deflating them again gains nothing
             zipf.write(
-                encrypted_file, os.path.basename(encrypted_file)
-            )  # Add encrypted or unencrypted file to zip
+                encrypted_file,
+                os.path.basename(encrypted_file),
+                compress_type=zipfile.ZIP_STORED,
+            )
     except Exception as e:
         logger.error(f"Error creating final padx.zip: {e}", exc_info=True)
         return None
@@ -5,11 +5,19 @@ from typing import Dict, Optional
 import streamlit as st
 from streamlit_cookies_controller import CookieController
 
-from utils.helpers.api import get_workflows, test_api
+from utils.helpers.api import (
+    cached_get_workflows,
+    cached_test_api,
+    get_workflows,
+    test_api,
+)
 
 # Initialize the cookie controller
 controller = CookieController()
 
+# Cookies that hold the persisted settings
+SETTINGS_COOKIES = ("api_url", "api_key", "category", "arzt_hash", "kassenname_hash")
+
 
 def get_cookie(cookie_name: str) -> Optional[str]:
     return controller.get(cookie_name)
@@ -28,16 +36,16 @@ def set_cookie(cookie_name: str, value: str, secure: bool = True) -> None:
 
 
 def load_settings_from_cookies() -> Dict[str, str]:
-    return {
-        "api_url": get_cookie("api_url") or None,
-        "api_key": get_cookie("api_key") or None,
-        "category": get_cookie("category") or None,
-        "arzt_hash": get_cookie("arzt_hash") or None,
-        "kassenname_hash": get_cookie("kassenname_hash") or None,
-    }
+    # Read all cookies in one call instead of one component round-trip per setting
+    all_cookies = controller.getAll() or {}
+    return {name: all_cookies.get(name) or None for name in SETTINGS_COOKIES}
 
 
 def save_settings_to_cookies() -> None:
+    # New credentials invalidate the cached API test and workflow list
+    cached_test_api.clear()
+    cached_get_workflows.clear()
+
     set_cookie("api_url", st.session_state.api_url)
     set_cookie("api_key", st.session_state.api_key)
     set_cookie("category", st.session_state.category)
@@ -1,16 +1,44 @@
 from datetime import date, datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from xsdata.models.datatype import XmlDateTime  # Import the XmlDateTime class
 
 from schemas.padnext_v2_py.padx_basis_v2_12 import GozifferTyp, LeistungspositionTyp
-from utils.helpers.db import read_in_goa
+from utils.helpers.db import GOA_FACTOR_COLUMNS, read_in_goa_index
 from utils.helpers.logger import logger
 from utils.utils import find_zitat_in_text
 
+# Types of the numeric columns in the ziffer DataFrame
+RESULT_DTYPES = {
+    "anzahl": "int64",
+    "confidence": "float64",
+    "einzelbetrag": "float64",
+    "gesamtbetrag": "float64",
+}
+
+# Columns of the analysis result in frontend order, with the value used when
+# the API response lacks the field
+ANALYZE_DEFAULTS = {
+    "ziffer": "",
+    "anzahl": 0,
+    "faktor": 0,
+    "text": "",
+    "zitat": "",
+    "begruendung": "",
+    "erschwerende_bedingungen": "",
+    "confidence": 1.0,
+    "analog": "",
+    "einzelbetrag": 0,
+    "gesamtbetrag": 0,
+    "go": "",
+    "confidence_reason": "",
+}
+
 
 def annotate_text_update() -> None:
     """
@@ -19,9 +47,11 @@ def annotate_text_update() -> None:
     """
     st.session_state.annotated_text_object = [st.session_state.text]
 
-    zitate_to_find: List[Tuple[str, str]] = [
-        (row["zitat"], row["ziffer"]) for _, row in st.session_state.df.iterrows()
-    ]
+    df = st.session_state.df
+    # Zip the column arrays instead of building a Series per row with iterrows
+    zitate_to_find: List[Tuple[str, str]] = list(
+        zip(df["zitat"].to_numpy(), df["ziffer"].to_numpy())
+    )
 
     st.session_state.annotated_text_object = find_zitat_in_text(
         zitate_to_find, st.session_state.annotated_text_object
@@ -33,13 +63,17 @@ def annotate_text_update() -> None:
     ]
     ziffer_order = list(dict.fromkeys(ziffer_order))
 
-    # Order the dataframe according to the order of the ziffer in the text
+    # Order the dataframe according to the order of the ziffer in the text,
+    # ziffern not found in the text keep their relative order at the end
     ziffer_order_dict = {ziffer: order for order, ziffer in enumerate(ziffer_order)}
-    st.session_state.df["order"] = st.session_state.df["ziffer"].map(ziffer_order_dict)
-    st.session_state.df["order"] = st.session_state.df["order"].fillna(9999)
-    st.session_state.df.sort_values("order", inplace=True)
-    st.session_state.df.drop("order", axis=1, inplace=True)
-    st.session_state.df.reset_index(drop=True, inplace=True)
+    ranks = np.fromiter(
+        (ziffer_order_dict.get(z, 9999) for z in st.session_state.df["ziffer"]),
+        dtype=np.int32,
+        count=len(st.session_state.df),
+    )
+    st.session_state.df = st.session_state.df.iloc[
+        np.argsort(ranks, kind="stable")
+    ].reset_index(drop=True)
 
 
 def df_to_processdocumentresponse(df: pd.DataFrame, ocr_text: str) -> Dict[str, Any]:
@@ -84,10 +118,14 @@ def df_to_processdocumentresponse(df: pd.DataFrame, ocr_text: str) -> Dict[str,
     return prediction_response
 
 
+@lru_cache(maxsize=4096)
 def format_ziffer_to_4digits(ziffer: str) -> str:
     """
     Format a billing code (ziffer) to a 4-digit format, preserving alphabetic characters and spaces.
 
+    The result is memoized, as the result stage formats every displayed ziffer on
+    each rerun while the set of distinct ziffern is small.
+
     Args:
         ziffer (str): The billing code to format.
 
@@ -136,48 +174,57 @@ def df_to_items(df: pd.DataFrame) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A list of dictionaries, each representing a billing item.
     """
     items = []
-    goa = read_in_goa(fully=True)
+    goa = read_in_goa_index(fully=True)
+    # Like the former filter + .values[0], the first row of a Ziffer wins
+    goa = goa[~goa.index.duplicated()]
+
+    # Resolve the GOÄ row of every billing row at once, analog Ziffern fall
+    # back to the Ziffer they are analog to
+    ziffern = df["ziffer"].astype(str)
+    is_analog = ~ziffern.isin(goa.index)
+    goa_ziffern = ziffern.where(~is_analog, ziffern.str.replace(" A", ""))
+    is_known = goa_ziffern.isin(goa.index)
+    goa_items = goa.reindex(goa_ziffern)
+
+    # Pick the factor column whose factor equals the intensity of the row,
+    # rows without a matching factor get no column and are priced by the
+    # thresholds of _calculate_price
+    factors = goa_items[list(GOA_FACTOR_COLUMNS)].to_numpy(dtype=float)
+    intensities = df["faktor"].to_numpy(dtype=float)
+    matches = np.isclose(factors, intensities[:, None])
+    column_names = [
+        GOA_FACTOR_COLUMNS[index] if matched else None
+        for index, matched in zip(
+            matches.argmax(axis=1).tolist(), matches.any(axis=1).tolist()
+        )
+    ]
 
-    for _, row in df.iterrows():
-        goa_item = goa[goa["GOÄZiffer"] == row["ziffer"]]
-        analog_ziffer = False
-
-        if goa_item.empty:
-            goa_analog_ziffer = row["ziffer"].replace(" A", "")
-            goa_item = goa[goa["GOÄZiffer"] == goa_analog_ziffer]
-            if goa_item.empty:
-                logger.error(
-                    f"No matching GOÄZiffer for analog Ziffer {goa_analog_ziffer}"
-                )
-                continue
-            analog_ziffer = True
+    for (_, row), (goa_ziffer, goa_item), analog_ziffer, known, column_name in zip(
+        df.iterrows(),
+        goa_items.iterrows(),
+        is_analog.tolist(),
+        is_known.tolist(),
+        column_names,
+    ):
+        if not known:
+            logger.error(f"No matching GOÄZiffer for analog Ziffer {goa_ziffer}")
+            continue
 
         intensity = row["faktor"]
-        intensity_str_period = f"{intensity:.1f}"
-        intensity_str_comma = intensity_str_period.replace(".", ",")
-
-        matching_columns = goa_item.columns[
-            goa_item.apply(
-                lambda col: col.astype(str).str.contains(
-                    f"(?:{intensity_str_period}|{intensity_str_comma})"
-                )
-            ).any()
-        ]
-
-        if matching_columns.empty:
-            matching_columns = ["Regelhöchstfaktor"]
-
-        column_name = matching_columns[0]
         faktor = intensity
 
         preis = _calculate_price(goa_item, column_name, faktor)
+        if np.isnan(preis):
+            # The GOÄ table lists no price ("-") for this factor range
+            logger.error(f"No price for GOÄZiffer {goa_ziffer} at factor {faktor}")
+            continue
 
         item = {
             "ziffer": row["ziffer"],
             "anzahl": row["anzahl"],
             "intensitat": intensity,
             "beschreibung": row["text"],
-            "Punktzahl": goa_item["Punktzahl"].values[0],
+            "Punktzahl": goa_item["Punktzahl"],
             "preis": preis,
             "faktor": faktor,
             "total": preis * int(row["anzahl"]),
@@ -197,30 +244,33 @@ def df_to_items(df: pd.DataFrame) -> List[Dict[str, Any]]:
     return items
 
 
-def _calculate_price(goa_item: pd.DataFrame, column_name: str, faktor: float) -> float:
+def _calculate_price(
+    goa_item: pd.Series, column_name: Optional[str], faktor: float
+) -> float:
     """
     Calculate the price based on the GOÄ item and factor.
 
     Args:
-        goa_item (pd.DataFrame): The GOÄ item DataFrame.
-        column_name (str): The name of the column to use for price calculation.
+        goa_item (pd.Series): The GOÄ row of the item.
+        column_name (Optional[str]): The factor column matching the intensity,
+            None to pick the price by the thresholds of the factor.
         faktor (float): The intensity factor.
 
     Returns:
         float: The calculated price.
     """
     if column_name == "Einfachfaktor":
-        return float(goa_item["Einfachsatz"].values[0].replace(",", "."))
+        return float(goa_item["Einfachsatz"])
     elif column_name == "Regelhöchstfaktor":
-        return float(goa_item["Regelhöchstsatz"].values[0].replace(",", "."))
+        return float(goa_item["Regelhöchstsatz"])
     elif column_name == "Höchstfaktor":
-        return float(goa_item["Höchstsatz"].values[0].replace(",", "."))
+        return float(goa_item["Höchstsatz"])
     elif faktor < 2:
-        return float(goa_item["Einfachsatz"].values[0].replace(",", "."))
+        return float(goa_item["Einfachsatz"])
     elif faktor < 3:
-        return float(goa_item["Regelhöchstsatz"].values[0].replace(",", "."))
+        return float(goa_item["Regelhöchstsatz"])
     else:
-        return float(goa_item["Höchstsatz"].values[0].replace(",", "."))
+        return float(goa_item["Höchstsatz"])
 
 
 def format_euro(value):
@@ -457,41 +507,80 @@ def analyze_add_data(data: list[dict]) -> dict:
         dict: Dictionary with keys 'ziffer', 'anzahl', 'faktor', 'text', 'zitat', and 'begruendung'.
     """
     try:
+        # One comprehension per column instead of thirteen appends per entry
         new_data = {
-            "ziffer": [],
-            "anzahl": [],
-            "faktor": [],
-            "text": [],
-            "zitat": [],
-            "begruendung": [],
-            "erschwerende_bedingungen": [],
-            "confidence": [],
-            "analog": [],
-            "einzelbetrag": [],
-            "gesamtbetrag": [],
-            "go": [],
-            "confidence_reason": [],
+            key: [entry.get(key, default) for entry in data]
+            for key, default in ANALYZE_DEFAULTS.items()
         }
 
-        for entry in data:
-            new_data["ziffer"].append(entry.get("ziffer", ""))
-            new_data["zitat"].append(entry.get("zitat", ""))
-            new_data["begruendung"].append(entry.get("begruendung", ""))
-            new_data["erschwerende_bedingungen"].append(
-                entry.get("erschwerende_bedingungen", "")
-            )
-            new_data["anzahl"].append(entry.get("anzahl", 0))
-            new_data["faktor"].append(entry.get("faktor", 0))
-            new_data["text"].append(entry.get("text", ""))
-            new_data["confidence"].append(entry.get("confidence", 1.0))
-            new_data["analog"].append(entry.get("analog", ""))
-            new_data["einzelbetrag"].append(entry.get("einzelbetrag", 0))
-            new_data["gesamtbetrag"].append(entry.get("gesamtbetrag", 0))
-            new_data["go"].append(entry.get("go", ""))
-            new_data["confidence_reason"].append(entry.get("confidence_reason", ""))
-
         return new_data
 
     except Exception as e:
         logger.error(f"Error processing data: {e}", exc_info=True)
         return {}
+
+
+def _cast_column(values: Any, dtype: str) -> np.ndarray:
+    """Cast a column to its known dtype without silently dropping decimals.
+
+    Args:
+        values (Any): The column values.
+        dtype (str): The target dtype from RESULT_DTYPES.
+
+    Returns:
+        np.ndarray: The typed column.
+
+    Raises:
+        ValueError: If casting to an integer dtype would change a value.
+    """
+    array = np.asarray(values)
+    typed = array.astype(dtype)
+    # Float to integer casts truncate, only whole numbers may become integers
+    if (
+        typed.dtype.kind == "i"
+        and array.dtype.kind == "f"
+        and not np.array_equal(typed, array)
+    ):
+        raise ValueError(f"Cannot cast non-integer values to {dtype}")
+    return typed
+
+
+def results_to_dataframe(
+    data: Union[Dict[str, List[Any]], List[Dict[str, Any]]],
+) -> pd.DataFrame:
+    """Build the ziffer DataFrame with the numeric column types known up front.
+
+    Args:
+        data (Union[Dict[str, List[Any]], List[Dict[str, Any]]]): Columns as returned
+            by analyze_add_data, or records as stored in the user modifications.
+
+    Returns:
+        pd.DataFrame: The ziffer DataFrame.
+    """
+    if isinstance(data, dict):
+        try:
+            # Typed columns skip pandas' per-column type inference
+            return pd.DataFrame(
+                {
+                    column: (
+                        _cast_column(values, RESULT_DTYPES[column])
+                        if column in RESULT_DTYPES
+                        else values
+                    )
+                    for column, values in data.items()
+                }
+            )
+        except (TypeError, ValueError):
+            return pd.DataFrame(data)
+
+    df = pd.DataFrame.from_records(data)
+    try:
+        return df.assign(
+            **{
+                column: _cast_column(df[column].to_numpy(), dtype)
+                for column, dtype in RESULT_DTYPES.items()
+                if column in df.columns
+            }
+        )
+    except (TypeError, ValueError):
+        return df
@@ -40,6 +40,24 @@ def read_xml_to_object(file_path: str, dataclass_type):
     return xml_object
 
 
+def read_xml_string_to_object(xml_content: str, dataclass_type):
+    """
+    Converts already loaded XML content into a Python object of the specified dataclass type.
+
+    Use this instead of read_xml_to_object when the file content has been read
+    before, e.g. for validation, so it isn't read and decoded a second time.
+
+    Args:
+        xml_content (str): The XML content as a string.
+        dataclass_type: The dataclass type to which the XML should be converted.
+
+    Returns:
+        object: An instance of the specified dataclass type populated with data from the XML content.
+    """
+    parser = XmlParser()
+    return parser.from_string(xml_content, dataclass_type)
+
+
 def write_object_to_xml(obj, output_path: str):
     """
     Serializes a Python object to an XML file with pre-processing to replace non-encodable characters.
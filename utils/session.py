@@ -1,4 +1,5 @@
 import os  # For accessing environment variables
+from copy import deepcopy
 from typing import Any, Dict, Optional
 
 import pandas as pd
@@ -8,6 +9,71 @@ from utils.helpers.background import get_thread_pool
 from utils.helpers.document_store import get_document_store
 from utils.helpers.logger import logger
 
+# Empty results DataFrame with its final column types, copied into new sessions
+_EMPTY_DF = pd.DataFrame(
+    {
+        "ziffer": [],
+        "anzahl": [],
+        "faktor": [],
+        "text": [],
+        "zitat": [],
+        "begruendung": [],
+        "confidence": [],
+        "analog": [],
+        "einzelbetrag": [],
+        "gesamtbetrag": [],
+        "go": [],
+        "confidence_reason": [],
+    }
+).astype(
+    {
+        "anzahl": "int",
+        "faktor": "int",
+        "einzelbetrag": "float",
+        "gesamtbetrag": "float",
+    },
+    errors="ignore",
+)
+
+# Default values for session state variables that are not set yet
+_SESSION_DEFAULTS: Dict[str, Any] = {
+    "stage": "analyze",
+    "text": None,
+    "annotated_text_object": [],
+    "ziffer_to_edit": None,
+    "pdf_ready": False,
+    "pdf_data": None,
+    "pdf_report_data": None,
+    "analyze_api_response": None,
+    "ocr_api_response": None,
+    "user_comment": None,
+    "pad_ready": False,
+    "pad_data_path": None,
+    "pad_data_ready": False,
+    "arzt_hash": None,
+    "kassenname_hash": None,
+    "session_id": None,
+    "minderung_data": {"prozentsatz": None, "begruendung": None},
+    "new_file_uploaded": False,
+    # Page selection related state
+    "page_selection": [],
+    "page_range": {"start": 1, "end": 1},
+    "current_set": 0,
+    "page_cache": {},
+    "loaded_pages": {},
+    "overlay_removed": False,
+    "page_selections": {},
+    "processing_started": False,
+    "api_key_tested": False,
+    "selected_ziffer": None,
+    "uploaded_file": None,
+    "sidebar_state": None,
+    "df": _EMPTY_DF,
+    # Document management
+    "selected_document_id": None,
+    "show_document_list": True,  # Controls sidebar visibility
+}
+
 
 def reset() -> None:
     """Reset the app to its initial state and rerun the script."""
@@ -89,37 +155,10 @@ def initialize_session_state(settings: Optional[Dict[str, Any]] = None) -> None:
         settings = {}
 
     # Initialize or reset session state variables if they do not exist
-    st.session_state.setdefault("stage", "analyze")
-    st.session_state.setdefault("text", None)
-    st.session_state.setdefault("annotated_text_object", [])
-    st.session_state.setdefault("ziffer_to_edit", None)
-    st.session_state.setdefault("pdf_ready", False)
-    st.session_state.setdefault("pdf_data", None)
-    st.session_state.setdefault("pdf_report_data", None)
-    st.session_state.setdefault("analyze_api_response", None)
-    st.session_state.setdefault("ocr_api_response", None)
-    st.session_state.setdefault("user_comment", None)
-    st.session_state.setdefault("pad_ready", False)
-    st.session_state.setdefault("pad_data_path", None)
-    st.session_state.setdefault("pad_data_ready", False)
-    st.session_state.setdefault("arzt_hash", None)
-    st.session_state.setdefault("kassenname_hash", None)
-    st.session_state.setdefault("session_id", None)
-    st.session_state.setdefault(
-        "minderung_data", {"prozentsatz": None, "begruendung": None}
-    )
-    st.session_state.setdefault("new_file_uploaded", False)
-
-    # Initialize page selection related state
-    st.session_state.setdefault("page_selection", [])
-    st.session_state.setdefault("page_range", {"start": 1, "end": 1})
-    st.session_state.setdefault("current_set", 0)
-    st.session_state.setdefault("page_cache", {})
-    st.session_state.setdefault("loaded_pages", {})
-    st.session_state.setdefault("overlay_removed", False)
-    st.session_state.setdefault("page_selections", {})
-    st.session_state.setdefault("processing_started", False)
-    st.session_state.setdefault("api_key_tested", False)
+    for key, value in _SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            # Copy so mutable defaults are never shared between sessions
+            st.session_state[key] = deepcopy(value)
 
     # Load API URL and API Key with the following hierarchy: settings > environment variable > fallback
     st.session_state.api_url = settings.get("api_url") or os.getenv(
@@ -132,43 +171,6 @@ def initialize_session_state(settings: Optional[Dict[str, Any]] = None) -> None:
     # Default category if not in settings
     st.session_state.category = settings.get("category") or None
 
-    st.session_state.setdefault("selected_ziffer", None)
-    st.session_state.setdefault("uploaded_file", None)
-    st.session_state.setdefault("sidebar_state", None)
-
-    # Initialize an empty DataFrame with specific columns and types
-    if "df" not in st.session_state:
-        data = {
-            "ziffer": [],
-            "anzahl": [],
-            "faktor": [],
-            "text": [],
-            "zitat": [],
-            "begruendung": [],
-            "confidence": [],
-            "analog": [],
-            "einzelbetrag": [],
-            "gesamtbetrag": [],
-            "go": [],
-            "confidence_reason": [],
-        }
-        df = pd.DataFrame(data)
-        st.session_state.df = df.astype(
-            {
-                "anzahl": "int",
-                "faktor": "int",
-                "einzelbetrag": "float",
-                "gesamtbetrag": "float",
-            },
-            errors="ignore",
-        )
-
-    # Add new session state variables for document management
-    st.session_state.setdefault("selected_document_id", None)
-    st.session_state.setdefault(
-        "show_document_list", True
-    )  # Controls sidebar visibility
-
     # Initialize document store if API key is available
     if st.session_state.api_key != "Ihr API Schlüssel":
         get_document_store()
@@ -3,7 +3,6 @@ from typing import Dict, List, Optional, Tuple
 import streamlit as st
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
-from utils.helpers.anonymization import anonymize_text
 from utils.helpers.canvas import (
     base_display_file_selection_interface,
     cleanup_session_state,
@@ -98,6 +97,9 @@ def anonymize_stage() -> None:
                     extracted_text = perform_ocr_on_file(
                         st.session_state.uploaded_file, selections=sorted_selections
                     )
+                    # Deferred so flair/torch only load once this stage is used
+                    from utils.helpers.anonymization import anonymize_text
+
                     anonymize_result = anonymize_text(extracted_text)
 
                     st.session_state.anonymized_text = anonymize_result[
@@ -2,7 +2,6 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import streamlit as st
-from streamlit_annotation_tools import text_labeler
 
 from utils.helpers.db import read_in_goa
 from utils.helpers.document_store import get_document_store
@@ -11,6 +10,54 @@ from utils.helpers.transform import concatenate_labels, format_euro
 from utils.utils import ziffer_from_options
 
 
+@st.cache_data(show_spinner=False)
+def get_goa_options() -> Tuple[List[str], List[str], List[str], Dict[str, int]]:
+    """
+    Build the selectbox option lists for the modal from the GOÄ catalog once.
+
+    Returns:
+        Tuple[List[str], List[str], List[str], Dict[str, int]]: The ziffer options,
+        the non-analog ziffer options, the matching descriptions and the position
+        of each ziffer in the ziffer options.
+    """
+    ziffer_dataframe: pd.DataFrame = read_in_goa()
+    ziffer_options: list = ziffer_dataframe["ziffer"].tolist()
+    ziffer_options_non_analog: list = ziffer_dataframe[
+        ziffer_dataframe["analog"].isna() | (ziffer_dataframe["analog"] == "")
+    ]["ziffer"].tolist()
+    ziffer_beschreibung: list = ziffer_dataframe["Beschreibung"].tolist()
+
+    # Keep the first position of each ziffer, like list.index would
+    ziffer_positions: Dict[str, int] = {}
+    for idx, ziffer in enumerate(ziffer_from_options(ziffer_options)):
+        ziffer_positions.setdefault(ziffer, idx)
+
+    return (
+        ziffer_options,
+        ziffer_options_non_analog,
+        ziffer_beschreibung,
+        ziffer_positions,
+    )
+
+
+def append_ziffer_row(row: Dict[str, Union[str, int, float, None]]) -> None:
+    """
+    Append a ziffer row to the session DataFrame.
+
+    The row is inserted in place when the DataFrame already has all of its columns
+    and a positional index, avoiding the full copy of pd.concat. Otherwise, e.g. for
+    the empty DataFrame after a reset, it falls back to pd.concat.
+
+    Args:
+        row (Dict[str, Union[str, int, float, None]]): The ziffer data to append.
+    """
+    df = st.session_state.df
+    if set(row).issubset(df.columns) and df.index.equals(pd.RangeIndex(len(df))):
+        df.loc[len(df)] = row
+    else:
+        st.session_state.df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
+
+
 def add_new_ziffer():
     new_row_id = (
         st.session_state.df["row_id"].max() + 1 if len(st.session_state.df) > 0 else 0
@@ -33,9 +80,7 @@ def add_new_ziffer():
         confidence=1.0,
         confidence_reason=None,
     )
-    st.session_state.df = pd.concat(
-        [st.session_state.df, pd.DataFrame([temp_row])], ignore_index=True
-    )
+    append_ziffer_row(temp_row)
     # Set the temporary row as the selected index
     st.session_state.selected_ziffer = temp_index
 
@@ -96,10 +141,7 @@ def update_ziffer(new_ziffer: Dict[str, Union[str, int, float, None]]) -> None:
             if st.session_state.ziffer_to_edit is not None:
                 st.session_state.df.iloc[st.session_state.ziffer_to_edit] = new_ziffer
             else:
-                new_row = pd.DataFrame(new_ziffer, index=[0])
-                st.session_state.df = pd.concat(
-                    [st.session_state.df, new_row], ignore_index=True
-                )
+                append_ziffer_row(new_ziffer)
         else:
             # Remove the temporary row if it's not valid
             if st.session_state.ziffer_to_edit is not None:
@@ -166,16 +208,17 @@ def modal_dialog() -> None:
     )
     try:
         ziffer_dataframe: pd.DataFrame = read_in_goa()
-        ziffer_options: list = ziffer_dataframe["ziffer"].tolist()
-        ziffer_options_non_analog: list = ziffer_dataframe[
-            ziffer_dataframe["analog"].isna() | (ziffer_dataframe["analog"] == "")
-        ]["ziffer"].tolist()
-        ziffer_beschreibung: list = ziffer_dataframe["Beschreibung"].tolist()
+        (
+            ziffer_options,
+            ziffer_options_non_analog,
+            ziffer_beschreibung,
+            ziffer_positions,
+        ) = get_goa_options()
 
         ziffer_data: Dict[str, Union[str, int, float, None]] = get_ziffer_data()
 
         ziffer_index: Optional[int] = get_ziffer_index(
-            ziffer_options, ziffer_data.get("ziffer")
+            ziffer_positions, ziffer_data.get("ziffer")
         )
 
         st.subheader("Ziffer")
@@ -356,13 +399,12 @@ def get_ziffer_data() -> Dict[str, Union[str, int, float, None]]:
         return st.session_state.df.iloc[st.session_state.ziffer_to_edit].to_dict()
 
 
-def get_ziffer_index(ziffer_options: List[str], ziffer: Optional[str]) -> Optional[int]:
+def get_ziffer_index(
+    ziffer_positions: Dict[str, int], ziffer: Optional[str]
+) -> Optional[int]:
     if ziffer is None:
         return None
-    try:
-        return ziffer_from_options(ziffer_options).index(ziffer)
-    except ValueError:
-        return None
+    return ziffer_positions.get(ziffer)
 
 
 def display_ziffer_selection(
@@ -437,6 +479,9 @@ def display_zitat_input(current_value: Optional[str], ziffer_str: Optional[str])
                 st.session_state.selected_document_id
             )
 
+            # Deferred so the labeler component only loads once it is needed
+            from streamlit_annotation_tools import text_labeler
+
             zitat = text_labeler(text=ocr_text, labels={ziffer_str: []})
             zitat = concatenate_labels(zitat)
             return zitat
@@ -4,7 +4,6 @@ from datetime import datetime
 
 import pandas as pd
 import streamlit as st
-from streamlit_pdf_viewer import pdf_viewer
 
 from utils.helpers.document_store import DocumentStatus, get_document_store
 from utils.helpers.feedback import handle_feedback_submission
@@ -12,12 +11,16 @@ from utils.helpers.logger import logger
 from utils.helpers.transform import (
     analyze_add_data,
     format_ziffer_to_4digits,
+    results_to_dataframe,
     split_recognized_and_potential,
 )
 from utils.stages.export_modal import export_modal
 from utils.stages.modal import add_new_ziffer, modal_dialog
 from utils.utils import get_temp_dir, highlight_text_in_pdf
 
+# Compiled once, sorting applies it to every Ziffer in the table
+ZIFFER_NUMBER_PATTERN = re.compile(r"\d+")
+
 
 def set_selected_ziffer(index):
     """Update selected ziffer and highlight text in PDF."""
@@ -78,7 +81,7 @@ def delete_ziffer(index):
 
 def extract_numeric_value(ziffer):
     # Extract the numeric portion of the Ziffer and convert to int after removing leading zeros
-    numeric_part = re.search(r"\d+", ziffer)
+    numeric_part = ZIFFER_NUMBER_PATTERN.search(ziffer)
     return int(numeric_part.group()) if numeric_part else float("inf")
 
 
@@ -133,6 +136,51 @@ def cleanup_temp_files():
                 )
 
 
+def render_ziffer_rows(df: pd.DataFrame, potential: bool = False) -> None:
+    """
+    Render one row of action buttons per ziffer in the given DataFrame.
+
+    Args:
+        df (pd.DataFrame): The recognized or potential ziffern to display.
+        potential (bool): Whether the rows are potential ziffern, which get an
+            additional button to move them to the recognized ones.
+    """
+    key_prefix = "pot_" if potential else ""
+
+    # itertuples avoids building a Series per row like iterrows does
+    for row in df.itertuples():
+        index = row.Index
+        # Update columns to add space for delete button
+        cols = st.columns([1, 1, 1, 0.4, 0.4, 0.4])
+
+        if cols[0].button(
+            format_ziffer_to_4digits(row.ziffer),
+            key=f"{key_prefix}ziffer_{row.row_id}",
+            type="secondary"
+            if st.session_state.selected_ziffer != index
+            else "primary",
+        ):
+            set_selected_ziffer(
+                None if st.session_state.selected_ziffer == index else index
+            )
+            st.rerun()
+
+        cols[1].write(row.anzahl)
+        cols[2].write(row.faktor)
+
+        if cols[3].button("✏️", key=f"{key_prefix}edit_{row.row_id}"):
+            st.session_state.ziffer_to_edit = index
+            modal_dialog()
+
+        if potential:
+            if cols[4].button("➕", key=f"pot_add_{row.row_id}"):
+                add_to_recognized(index)
+            if cols[5].button("🗑️", key=f"pot_delete_{row.row_id}"):
+                delete_ziffer(index)
+        elif cols[4].button("🗑️", key=f"delete_{row.row_id}"):
+            delete_ziffer(index)
+
+
 def result_stage() -> None:
     """Display the result stage in the Streamlit app."""
     # Collapse sidebar when entering result stage
@@ -202,12 +250,12 @@ def result_stage() -> None:
     if st.session_state.df is None or len(st.session_state.df) == 0:
         # Check for user modifications first
         if document.get("user_modifications"):
-            st.session_state.df = pd.DataFrame(document["user_modifications"])
+            st.session_state.df = results_to_dataframe(document["user_modifications"])
         else:
             # Fall back to original API result
             result = document["result"]
             processed_data = analyze_add_data(result)
-            st.session_state.df = pd.DataFrame(processed_data)
+            st.session_state.df = results_to_dataframe(processed_data)
 
     # Check if we need to clean up after adding a new ziffer
     if st.session_state.get("adding_new_ziffer", False):
@@ -268,31 +316,7 @@ def result_stage() -> None:
                 col.markdown(f"**{header}**")
 
         # Display recognized services
-        for index, row in recognized_df.iterrows():
-            # Update columns to add space for delete button
-            cols = st.columns([1, 1, 1, 0.4, 0.4, 0.4])
-
-            if cols[0].button(
-                format_ziffer_to_4digits(row["ziffer"]),
-                key=f"ziffer_{row['row_id']}",
-                type="secondary"
-                if st.session_state.selected_ziffer != index
-                else "primary",
-            ):
-                set_selected_ziffer(
-                    None if st.session_state.selected_ziffer == index else index
-                )
-                st.rerun()
-
-            cols[1].write(row["anzahl"])
-            cols[2].write(row["faktor"])
-
-            if cols[3].button("✏️", key=f"edit_{row['row_id']}"):
-                st.session_state.ziffer_to_edit = index
-                modal_dialog()
-
-            if cols[4].button("🗑️", key=f"delete_{row['row_id']}"):
-                delete_ziffer(index)
+        render_ziffer_rows(recognized_df)
 
         # Add new Ziffer button
         if st.button(
@@ -306,32 +330,7 @@ def result_stage() -> None:
         # Potential services section
         st.subheader("Potentielle Leistungsziffern")
 
-        for index, row in potential_df.iterrows():
-            # Update columns to add space for delete button
-            cols = st.columns([1, 1, 1, 0.4, 0.4, 0.4])
-
-            if cols[0].button(
-                format_ziffer_to_4digits(row["ziffer"]),
-                key=f"pot_ziffer_{row['row_id']}",
-                type="secondary"
-                if st.session_state.selected_ziffer != index
-                else "primary",
-            ):
-                set_selected_ziffer(
-                    None if st.session_state.selected_ziffer == index else index
-                )
-                st.rerun()
-
-            cols[1].write(row["anzahl"])
-            cols[2].write(row["faktor"])
-
-            if cols[3].button("✏️", key=f"pot_edit_{row['row_id']}"):
-                st.session_state.ziffer_to_edit = index
-                modal_dialog()
-            if cols[4].button("➕", key=f"pot_add_{row['row_id']}"):
-                add_to_recognized(index)
-            if cols[5].button("🗑️", key=f"pot_delete_{row['row_id']}"):
-                delete_ziffer(index)
+        render_ziffer_rows(potential_df, potential=True)
 
         # Remove the bottom_cols split and create a container for buttons at the bottom
         st.write("")  # Add some spacing
@@ -349,6 +348,9 @@ def result_stage() -> None:
         ) or document_store.get_document_path(st.session_state.selected_document_id)
 
         if pdf_path:
+            # Deferred so the viewer component only loads once a result is shown
+            from streamlit_pdf_viewer import pdf_viewer
+
             pdf_height = max(800, min(1400, 100 * len(st.session_state.original_df)))
             pdf_viewer(pdf_path, height=pdf_height)
         else:
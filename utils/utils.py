@@ -1,7 +1,9 @@
 import io
 import os
+import re
 import tempfile
 import zipfile
+from collections import deque
 from html import escape
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
@@ -14,10 +16,16 @@ from Levenshtein import distance as levenshtein_distance
 from utils.helpers.document_store import get_document_store
 from utils.helpers.logger import logger
 
+# Separates the parts of a zitat: line breaks and "[...]" placeholders
+ZITAT_SPLIT_PATTERN = re.compile(r"\n|\[\.\.\.\]")
+
 
 def flatten(lst: Union[List[Any], str]) -> List[Any]:
     """
-    Recursively flattens a nested list. If the input is a string, returns it as a single-element list.
+    Flattens a nested list. If the input is a string, returns it as a single-element list.
+
+    Nested lists are unrolled onto a work queue instead of recursing, so deeply
+    nested input neither builds intermediate lists nor hits the recursion limit.
 
     Args:
         lst (Union[List[Any], str]): The list to flatten or a string.
@@ -29,9 +37,12 @@ def flatten(lst: Union[List[Any], str]) -> List[Any]:
         return [lst]
 
     result = []
-    for item in lst:
+    pending = deque(lst)
+    while pending:
+        item = pending.popleft()
         if isinstance(item, list):
-            result.extend(flatten(item))
+            # Put the items in front of the queue so the order is preserved
+            pending.extendleft(reversed(item))
         else:
             result.append(item)
     return result
@@ -47,17 +58,8 @@ def clean_zitat(zitat: str) -> List[str]:
     Returns:
         List[str]: A list of cleaned parts of the zitat.
     """
-    lines = zitat.split("\n")
-    cleaned_lines = []
-
-    for line in lines:
-        parts = line.split("[...]")
-        for part in parts:
-            cleaned_part = part.strip()
-            if cleaned_part:
-                cleaned_lines.append(cleaned_part)
-
-    return cleaned_lines
+    # One C-level split on line breaks and placeholders instead of nested splits
+    return [part for part in map(str.strip, ZITAT_SPLIT_PATTERN.split(zitat)) if part]
 
 
 def find_zitat_in_text(
@@ -98,30 +100,36 @@ def find_zitat_in_text(
 
     list_of_indices = []
 
-    # Sliding window with Levenshtein distance for approximate matching
     for zitat, zitat_label in list_of_zitate_to_find:
         cleaned_zitat = zitat.replace("\n", " ").replace("  ", " ")
 
-        # Set up sliding window mechanism
         zitat_len = len(cleaned_zitat)
         best_match = None
-        best_distance = float("inf")
         best_match_indices = None
 
-        # Slide over the text in windows of size 'window_size'
-        for i in range(len(cleaned_text) - zitat_len + 1):
-            window_text = cleaned_text[i : i + zitat_len]
+        # An exact quote is found by the C substring search, the sliding window
+        # is only needed when the quote differs from the text
+        best_start = cleaned_text.find(cleaned_zitat) if cleaned_zitat else -1
+        if best_start >= 0:
+            best_match = cleaned_zitat
+            best_match_indices = (best_start, best_start + zitat_len)
+        else:
+            best_distance = float("inf")
+
+            # Sliding window with Levenshtein distance for approximate matching
+            for i in range(len(cleaned_text) - zitat_len + 1):
+                window_text = cleaned_text[i : i + zitat_len]
 
-            # Calculate Levenshtein distance between the quote and the window text
-            current_distance = levenshtein_distance(cleaned_zitat, window_text)
+                # Calculate Levenshtein distance between the quote and the window text
+                current_distance = levenshtein_distance(cleaned_zitat, window_text)
 
-            if (
-                current_distance < best_distance
-                and current_distance <= distance_threshold
-            ):
-                best_distance = current_distance
-                best_match = window_text
-                best_match_indices = (i, i + zitat_len)
+                if (
+                    current_distance < best_distance
+                    and current_distance <= distance_threshold
+                ):
+                    best_distance = current_distance
+                    best_match = window_text
+                    best_match_indices = (i, i + zitat_len)
 
         if best_match:
             start_idx, end_idx = best_match_indices